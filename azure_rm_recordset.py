@@ -34,7 +34,7 @@ options:
     relative_record_set_name:
         description:
             - 'The name of the record set, relative to the name of the zone.'
-        required: true
+            - Required unless I(record_sets) is specified.
         type: str
     record_type:
         description:
@@ -46,7 +46,7 @@ options:
             - >-
                 The type of DNS record in this record set. Record sets of type SOA
                 cannot be deleted (they are deleted when the DNS zone is deleted).
-        required: true
+            - Required together with I(relative_record_set_name).
         type: str
         choices:
             - A
@@ -245,6 +245,248 @@ options:
                 Set to '*' to allow a new record set to be created, but to prevent
                 updating an existing record set. Other values will be ignored.
         type: str
+    record_sets:
+        description:
+            - >-
+                List of record sets to reconcile against the zone in a single run.
+            - >-
+                The zone is listed once and only record sets that differ from the
+                desired state are created, updated or deleted.
+            - Mutually exclusive with I(relative_record_set_name).
+        type: list
+        elements: dict
+        suboptions:
+            relative_record_set_name:
+                description:
+                    - 'The name of the record set, relative to the name of the zone.'
+                required: true
+                type: str
+            record_type:
+                description:
+                    - The type of DNS record in this record set.
+                required: true
+                type: str
+                choices:
+                    - A
+                    - AAAA
+                    - CAA
+                    - CNAME
+                    - MX
+                    - NS
+                    - PTR
+                    - SOA
+                    - SRV
+                    - TXT
+            state:
+                description:
+                    - Assert the state of this record set.
+                default: present
+                type: str
+                choices:
+                    - absent
+                    - present
+            metadata:
+                description:
+                    - The metadata attached to the record set.
+                type: dict
+            ttl:
+                description:
+                    - The TTL (time-to-live) of the records in the record set.
+                type: int
+            target_resource:
+                description:
+                    - >-
+                        A reference to an azure resource from where the dns resource value is
+                        taken.
+                type: dict
+                suboptions:
+                    id:
+                        description:
+                            - Resource Id.
+                        type: str
+            a_records:
+                description:
+                    - The list of A records in the record set.
+                type: list
+                suboptions:
+                    ipv4_address:
+                        description:
+                            - The IPv4 address of this A record.
+                        type: str
+            aaaa_records:
+                description:
+                    - The list of AAAA records in the record set.
+                type: list
+                suboptions:
+                    ipv6_address:
+                        description:
+                            - The IPv6 address of this AAAA record.
+                        type: str
+            mx_records:
+                description:
+                    - The list of MX records in the record set.
+                type: list
+                suboptions:
+                    preference:
+                        description:
+                            - The preference value for this MX record.
+                        type: int
+                    exchange:
+                        description:
+                            - The domain name of the mail host for this MX record.
+                        type: str
+            ns_records:
+                description:
+                    - The list of NS records in the record set.
+                type: list
+                suboptions:
+                    nsdname:
+                        description:
+                            - The name server name for this NS record.
+                        type: str
+            ptr_records:
+                description:
+                    - The list of PTR records in the record set.
+                type: list
+                suboptions:
+                    ptrdname:
+                        description:
+                            - The PTR target domain name for this PTR record.
+                        type: str
+            srv_records:
+                description:
+                    - The list of SRV records in the record set.
+                type: list
+                suboptions:
+                    priority:
+                        description:
+                            - The priority value for this SRV record.
+                        type: int
+                    weight:
+                        description:
+                            - The weight value for this SRV record.
+                        type: int
+                    port:
+                        description:
+                            - The port value for this SRV record.
+                        type: int
+                    target:
+                        description:
+                            - The target domain name for this SRV record.
+                        type: str
+            txt_records:
+                description:
+                    - The list of TXT records in the record set.
+                type: list
+                suboptions:
+                    value:
+                        description:
+                            - The text value of this TXT record.
+                        type: list
+            cname_record:
+                description:
+                    - The CNAME record in the  record set.
+                type: dict
+                suboptions:
+                    cname:
+                        description:
+                            - The canonical name for this CNAME record.
+                        type: str
+            soa_record:
+                description:
+                    - The SOA record in the record set.
+                type: dict
+                suboptions:
+                    host:
+                        description:
+                            - >-
+                                The domain name of the authoritative name server for this SOA
+                                record.
+                        type: str
+                    email:
+                        description:
+                            - The email contact for this SOA record.
+                        type: str
+                    serial_number:
+                        description:
+                            - The serial number for this SOA record.
+                        type: int
+                    refresh_time:
+                        description:
+                            - The refresh value for this SOA record.
+                        type: int
+                    retry_time:
+                        description:
+                            - The retry time for this SOA record.
+                        type: int
+                    expire_time:
+                        description:
+                            - The expire time for this SOA record.
+                        type: int
+                    minimum_ttl:
+                        description:
+                            - >-
+                                The minimum value for this SOA record. By convention this is used to
+                                determine the negative caching duration.
+                        type: int
+            caa_records:
+                description:
+                    - The list of CAA records in the record set.
+                type: list
+                suboptions:
+                    flags:
+                        description:
+                            - The flags for this CAA record as an integer between 0 and 255.
+                        type: int
+                    tag:
+                        description:
+                            - The tag for this CAA record.
+                        type: str
+                    value:
+                        description:
+                            - The value for this CAA record.
+                        type: str
+    zone_file:
+        description:
+            - >-
+                Path of an RFC 1035 zone file to import. Its A, AAAA, CAA, CNAME, MX,
+                NS, PTR, SOA, SRV and TXT records are grouped into record sets and
+                reconciled like I(record_sets).
+            - >-
+                The SOA host and the NS records at the zone apex are not imported, they
+                are assigned by Azure DNS.
+            - Combine with I(exclusive) to remove record sets missing from the file.
+            - Mutually exclusive with I(relative_record_set_name) and I(record_sets).
+        type: path
+    conditional_update:
+        description:
+            - >-
+                When the etag of the record set is known, from I(if_match) or from
+                I(etag_cache), send the update as a conditional PUT and skip reading and
+                comparing the current record set.
+            - >-
+                If an etag from I(etag_cache) is stale the service rejects the PUT and the
+                module falls back to the regular read and compare, guarded by the etag it
+                just read.
+            - If the I(if_match) etag is stale the module fails and leaves the record set unchanged.
+            - The module always reports a change when the conditional PUT succeeds.
+        type: bool
+        default: false
+    etag_cache:
+        description:
+            - >-
+                Path of a local JSON file holding the last-seen etag of each record set
+                managed by this module.
+            - It is updated after every read, update and delete.
+        type: path
+    exclusive:
+        description:
+            - >-
+                When used with I(record_sets), delete record sets in the zone that are
+                not listed.
+            - The SOA record set and the NS record set at the zone apex are never deleted.
+        type: bool
+        default: false
     state:
         description:
             - Assert the state of the RecordSet.
@@ -585,6 +827,47 @@ EXAMPLES = '''
         resource_group_name: rg1
         zone_name: zone1
 
+    - name: Import a zone file
+      azure_rm_recordset:
+        resource_group: rg1
+        zone_name: contoso.com
+        zone_file: /tmp/contoso.com.zone
+        exclusive: true
+
+    - name: Update an ACME challenge with a conditional PUT
+      azure_rm_recordset:
+        resource_group: rg1
+        zone_name: zone1
+        relative_record_set_name: _acme-challenge
+        record_type: TXT
+        ttl: 60
+        txt_records:
+          - value:
+              - challenge-token
+        conditional_update: true
+        etag_cache: /var/cache/ansible/dns-etags.json
+
+    - name: Reconcile several recordsets in one run
+      azure_rm_recordset:
+        resource_group: rg1
+        zone_name: zone1
+        record_sets:
+          - relative_record_set_name: www
+            record_type: A
+            ttl: 3600
+            a_records:
+              - ipv4_address: 10.0.0.1
+              - ipv4_address: 10.0.0.2
+          - relative_record_set_name: mail
+            record_type: MX
+            ttl: 3600
+            mx_records:
+              - exchange: mail.contoso.com
+                preference: 10
+          - relative_record_set_name: old
+            record_type: CNAME
+            state: absent
+
 '''
 
 RETURN = '''
@@ -813,9 +1096,35 @@ caa_records:
                 - The value for this CAA record.
             type: str
             sample: null
+record_sets:
+    description:
+        - The record sets changed by a I(record_sets) or I(zone_file) run.
+    returned: when I(record_sets) or I(zone_file) is specified
+    type: list
+    sample: null
+    contains:
+        relative_record_set_name:
+            description:
+                - 'The name of the record set, relative to the name of the zone.'
+            type: str
+            sample: www
+        record_type:
+            description:
+                - The type of DNS record in this record set.
+            type: str
+            sample: A
+        action:
+            description:
+                - The change applied to the record set.
+            type: str
+            sample: create
 
 '''
 
+import json
+import os
+import tempfile
+from collections import OrderedDict
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBaseExt
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -831,6 +1140,205 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
+RECORD_SET_PROPERTIES = ['metadata',
+                         'ttl',
+                         'target_resource',
+                         'a_records',
+                         'aaaa_records',
+                         'mx_records',
+                         'ns_records',
+                         'ptr_records',
+                         'srv_records',
+                         'txt_records',
+                         'cname_record',
+                         'soa_record',
+                         'caa_records']
+
+
+def zone_file_tokens(line):
+    tokens = []
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if char in ' \t\r\n':
+            i += 1
+        elif char == ';':
+            break
+        elif char in '()':
+            tokens.append((char, False))
+            i += 1
+        elif char == '"':
+            value = []
+            i += 1
+            while i < len(line) and line[i] != '"':
+                if line[i] == '\\' and line[i + 1:i + 4].isdigit():
+                    value.append(chr(int(line[i + 1:i + 4])))
+                    i += 4
+                elif line[i] == '\\' and i + 1 < len(line):
+                    value.append(line[i + 1])
+                    i += 2
+                else:
+                    value.append(line[i])
+                    i += 1
+            tokens.append((''.join(value), True))
+            i += 1
+        else:
+            start = i
+            while i < len(line) and line[i] not in ' \t\r\n;()"':
+                i += 1
+            tokens.append((line[start:i], False))
+    return tokens
+
+
+def zone_file_entries(lines):
+    '''
+    Yield (line number, owner omitted, tokens) for every entry of a zone file,
+    joining entries that continue over several lines inside parentheses.
+    '''
+    tokens = []
+    depth = 0
+    for line_number, line in enumerate(lines, 1):
+        line_tokens = zone_file_tokens(line)
+        if depth == 0:
+            if not line_tokens:
+                continue
+            entry_line = line_number
+            owner_omitted = line[:1] in (' ', '\t')
+            tokens = []
+        for token in line_tokens:
+            if token == ('(', False):
+                depth += 1
+            elif token == (')', False):
+                depth -= 1
+            else:
+                tokens.append(token[0])
+        if depth == 0:
+            yield entry_line, owner_omitted, tokens
+    if depth != 0:
+        raise ValueError('unbalanced parentheses at end of file')
+
+
+def parse_ttl(value):
+    units = dict(s=1, m=60, h=3600, d=86400, w=604800)
+    if value.isdigit():
+        return int(value)
+    ttl = 0
+    number = ''
+    for char in value.lower():
+        if char.isdigit():
+            number += char
+        elif char in units and number:
+            ttl += int(number) * units[char]
+            number = ''
+        else:
+            raise ValueError('invalid TTL {0}'.format(value))
+    if number:
+        raise ValueError('invalid TTL {0}'.format(value))
+    return ttl
+
+
+def absolute_name(name, origin):
+    if name == '@':
+        return origin
+    if name.endswith('.'):
+        return name
+    return name + '.' + origin
+
+
+def target_name(name, origin):
+    return absolute_name(name, origin).rstrip('.') or '.'
+
+
+def relative_name(name, zone):
+    if name.lower() == zone.lower():
+        return '@'
+    if name.lower().endswith('.' + zone.lower()):
+        return name[:-len(zone) - 1]
+    raise ValueError('{0} is outside of zone {1}'.format(name, zone))
+
+
+# Maps each record type to the record set option it fills and a builder turning
+# the record data of one zone file entry into that option's structure.
+ZONE_FILE_RECORDS = {
+    'A': ('a_records', lambda data, origin: dict(ipv4_address=data[0])),
+    'AAAA': ('aaaa_records', lambda data, origin: dict(ipv6_address=data[0])),
+    'CAA': ('caa_records', lambda data, origin: dict(flags=int(data[0]), tag=data[1], value=data[2])),
+    'CNAME': ('cname_record', lambda data, origin: dict(cname=target_name(data[0], origin))),
+    'MX': ('mx_records', lambda data, origin: dict(preference=int(data[0]),
+                                                   exchange=target_name(data[1], origin))),
+    'NS': ('ns_records', lambda data, origin: dict(nsdname=target_name(data[0], origin))),
+    'PTR': ('ptr_records', lambda data, origin: dict(ptrdname=target_name(data[0], origin))),
+    # The SOA host is assigned by Azure DNS and cannot be changed, so it is not imported.
+    'SOA': ('soa_record', lambda data, origin: dict(email=target_name(data[1], origin),
+                                                    serial_number=int(data[2]),
+                                                    refresh_time=parse_ttl(data[3]),
+                                                    retry_time=parse_ttl(data[4]),
+                                                    expire_time=parse_ttl(data[5]),
+                                                    minimum_ttl=parse_ttl(data[6]))),
+    'SRV': ('srv_records', lambda data, origin: dict(priority=int(data[0]),
+                                                     weight=int(data[1]),
+                                                     port=int(data[2]),
+                                                     target=target_name(data[3], origin))),
+    'TXT': ('txt_records', lambda data, origin: dict(value=list(data))),
+}
+
+
+def parse_zone_file(lines, zone_name):
+    '''
+    Parse an RFC 1035 zone file into a list of record sets shaped like the
+    record_sets option. Name servers at the zone apex are skipped, Azure DNS
+    assigns them when the zone is created.
+    '''
+    zone = zone_name.rstrip('.') + '.'
+    origin = zone
+    default_ttl = 3600
+    owner = None
+    record_sets = OrderedDict()
+    for line_number, owner_omitted, tokens in zone_file_entries(lines):
+        try:
+            if not owner_omitted and tokens[0].startswith('$'):
+                if tokens[0].upper() == '$ORIGIN':
+                    origin = absolute_name(tokens[1], origin)
+                elif tokens[0].upper() == '$TTL':
+                    default_ttl = parse_ttl(tokens[1])
+                else:
+                    raise ValueError('unsupported directive {0}'.format(tokens[0]))
+                continue
+            if not owner_omitted:
+                owner = absolute_name(tokens.pop(0), origin)
+            if owner is None:
+                raise ValueError('record without an owner name')
+            ttl = None
+            while tokens[0].upper() in ('IN', 'CH', 'CS', 'HS') or tokens[0][:1].isdigit():
+                if tokens[0][:1].isdigit():
+                    ttl = parse_ttl(tokens[0])
+                tokens.pop(0)
+            record_type = tokens.pop(0).upper()
+            if record_type not in ZONE_FILE_RECORDS:
+                raise ValueError('unsupported record type {0}'.format(record_type))
+            name = relative_name(owner, zone)
+            if record_type == 'NS' and name == '@':
+                continue
+            key, build = ZONE_FILE_RECORDS[record_type]
+            record = build(tokens, origin)
+        except (IndexError, ValueError) as exc:
+            message = str(exc) if isinstance(exc, ValueError) else 'missing record data'
+            raise ValueError('line {0}: {1}'.format(line_number, message))
+
+        record_set = record_sets.get((name.lower(), record_type))
+        if record_set is None:
+            record_set = dict(relative_record_set_name=name,
+                              record_type=record_type,
+                              state='present',
+                              ttl=ttl if ttl is not None else default_ttl)
+            record_sets[(name.lower(), record_type)] = record_set
+        if key.endswith('_records'):
+            record_set.setdefault(key, []).append(record)
+        else:
+            record_set[key] = record
+    return list(record_sets.values())
+
+
 class AzureRMRecordSet(AzureRMModuleBaseExt):
     def __init__(self):
         self.module_arg_spec = dict(
@@ -843,8 +1351,7 @@ class AzureRMRecordSet(AzureRMModuleBaseExt):
                 required=True
             ),
             relative_record_set_name=dict(
-                type='str',
-                required=True
+                type='str'
             ),
             record_type=dict(
                 type='str',
@@ -857,8 +1364,7 @@ class AzureRMRecordSet(AzureRMModuleBaseExt):
                          'PTR',
                          'SOA',
                          'SRV',
-                         'TXT'],
-                required=True
+                         'TXT']
             ),
             if_match=dict(
                 type='str'
@@ -1045,12 +1551,59 @@ class AzureRMRecordSet(AzureRMModuleBaseExt):
             if_none_match=dict(
                 type='str'
             ),
+            state=dict(
+                type='str',
+                default='present',
+                choices=['present', 'absent']
+            ),
+            zone_file=dict(
+                type='path'
+            ),
+            conditional_update=dict(
+                type='bool',
+                default=False
+            ),
+            etag_cache=dict(
+                type='path'
+            ),
+            exclusive=dict(
+                type='bool',
+                default=False
+            )
+        )
+
+        self.record_set_spec = dict(
+            relative_record_set_name=dict(
+                type='str',
+                required=True
+            ),
+            record_type=dict(
+                type='str',
+                choices=['A',
+                         'AAAA',
+                         'CAA',
+                         'CNAME',
+                         'MX',
+                         'NS',
+                         'PTR',
+                         'SOA',
+                         'SRV',
+                         'TXT'],
+                required=True
+            ),
             state=dict(
                 type='str',
                 default='present',
                 choices=['present', 'absent']
             )
         )
+        for key in RECORD_SET_PROPERTIES:
+            self.record_set_spec[key] = self.module_arg_spec[key]
+        self.module_arg_spec['record_sets'] = dict(
+            type='list',
+            elements='dict',
+            options=self.record_set_spec
+        )
 
         self.resource_group = None
         self.zone_name = None
@@ -1058,6 +1611,11 @@ class AzureRMRecordSet(AzureRMModuleBaseExt):
         self.record_type = None
         self.if_match = None
         self.if_none_match = None
+        self.record_sets = None
+        self.zone_file = None
+        self.conditional_update = None
+        self.etag_cache = None
+        self.exclusive = None
         self.body = {}
 
         self.results = dict(changed=False)
@@ -1067,7 +1625,13 @@ class AzureRMRecordSet(AzureRMModuleBaseExt):
 
         super(AzureRMRecordSet, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                supports_check_mode=True,
-                                               supports_tags=True)
+                                               supports_tags=True,
+                                               mutually_exclusive=[['relative_record_set_name', 'record_sets', 'zone_file'],
+                                                                   ['if_match', 'record_sets', 'zone_file'],
+                                                                   ['if_none_match', 'record_sets', 'zone_file'],
+                                                                   ['conditional_update', 'record_sets', 'zone_file']],
+                                               required_one_of=[['relative_record_set_name', 'record_sets', 'zone_file']],
+                                               required_together=[['relative_record_set_name', 'record_type']])
 
     def exec_module(self, **kwargs):
         for key in list(self.module_arg_spec.keys()):
@@ -1085,11 +1649,29 @@ class AzureRMRecordSet(AzureRMModuleBaseExt):
                                                     base_url=self._cloud_environment.endpoints.resource_manager,
                                                     api_version='2018-05-01')
 
-        if 'location' not in self.body:
-            resource_group = self.get_resource_group(self.resource_group)
-            self.body['location'] = resource_group.location
+        if self.zone_file is not None:
+            self.record_sets = self.read_zone_file()
+
+        if self.record_sets is not None:
+            self.reconcile_record_sets()
+            return self.results
+
+        stale_etag = False
+        if self.conditional_update and self.state == 'present' and not self.check_mode:
+            etag = self.if_match or self.read_cached_etag()
+            if etag is not None:
+                response = self.conditional_update_resource(etag)
+                if response:
+                    self.results['changed'] = True
+                    self.results['etag'] = response.get('etag')
+                    self.write_cached_etag(response.get('etag'))
+                    return self.results
+                # The cached etag was stale; guard the full update with the one read below instead.
+                stale_etag = True
 
         old_response = self.get_resource()
+        if stale_etag and old_response:
+            self.if_match = old_response.get('etag')
 
         if not old_response:
             if self.state == 'present':
@@ -1120,8 +1702,141 @@ class AzureRMRecordSet(AzureRMModuleBaseExt):
             response = old_response
             self.results['state'] = response
 
+        if response:
+            self.results['etag'] = response.get('etag')
+        self.write_cached_etag(response.get('etag') if response else None)
+
         return self.results
 
+    def reconcile_record_sets(self):
+        existing = {}
+        for item in self.list_all_record_sets():
+            existing[self.record_set_key(item['name'], item['type'].split('/')[-1])] = item
+
+        modifiers = {}
+        self.create_compare_modifiers(self.record_set_spec, '', modifiers)
+        self.results['compare'] = []
+
+        changes = []
+        for record_set in self.record_sets:
+            old_response = existing.pop(self.record_set_key(record_set['relative_record_set_name'],
+                                                            record_set['record_type']), None)
+            body = {}
+            for key in RECORD_SET_PROPERTIES:
+                if record_set.get(key) is not None:
+                    body[key] = record_set[key]
+            self.inflate_parameters(self.record_set_spec, body, 0)
+
+            if record_set['state'] == 'absent':
+                if old_response:
+                    changes.append((record_set, Actions.Delete, None))
+            elif not old_response:
+                changes.append((record_set, Actions.Create, body))
+            elif not self.default_compare(modifiers, body, old_response, '', self.results):
+                changes.append((record_set, Actions.Update, body))
+
+        if self.exclusive:
+            for item in existing.values():
+                record_type = item['type'].split('/')[-1]
+                if record_type == 'SOA' or (record_type == 'NS' and item['name'] == '@'):
+                    continue
+                changes.append(({'relative_record_set_name': item['name'], 'record_type': record_type},
+                                Actions.Delete, None))
+
+        self.results['changed'] = len(changes) > 0
+        self.results['record_sets'] = [dict(relative_record_set_name=record_set['relative_record_set_name'],
+                                            record_type=record_set['record_type'],
+                                            action={Actions.Create: 'create',
+                                                    Actions.Update: 'update',
+                                                    Actions.Delete: 'delete'}[to_do])
+                                       for record_set, to_do, body in changes]
+        if self.check_mode:
+            return
+
+        for record_set, to_do, body in changes:
+            self.relative_record_set_name = record_set['relative_record_set_name']
+            self.record_type = record_set['record_type']
+            if to_do == Actions.Delete:
+                self.delete_resource()
+            else:
+                self.body = body
+                self.create_update_resource()
+
+    def read_zone_file(self):
+        try:
+            with open(self.zone_file) as zone_file:
+                return parse_zone_file(zone_file, self.zone_name)
+        except (IOError, OSError, ValueError) as exc:
+            self.fail('Error reading zone file {0}: {1}'.format(self.zone_file, str(exc)))
+
+    def record_set_key(self, name, record_type):
+        return (name.lower(), record_type.upper())
+
+    def list_all_record_sets(self):
+        try:
+            response = self.mgmt_client.record_sets.list_all_by_dns_zone(resource_group_name=self.resource_group,
+                                                                         zone_name=self.zone_name)
+            return [item.as_dict() for item in response]
+        except CloudError as exc:
+            self.log('Error attempting to list the RecordSet instances.')
+            self.fail('Error listing the RecordSet instances: {0}'.format(str(exc)))
+
+    def conditional_update_resource(self, etag):
+        try:
+            response = self.mgmt_client.record_sets.create_or_update(resource_group_name=self.resource_group,
+                                                                     zone_name=self.zone_name,
+                                                                     relative_record_set_name=self.relative_record_set_name,
+                                                                     record_type=self.record_type,
+                                                                     if_match=etag,
+                                                                     parameters=self.body)
+            if isinstance(response, AzureOperationPoller) or isinstance(response, LROPoller):
+                response = self.get_poller_result(response)
+        except CloudError as exc:
+            # A stale if_match of the caller is a conflict to report, only a stale cached etag falls back.
+            if exc.status_code == 412 and self.if_match is None:
+                self.log('The cached etag of the RecordSet instance is stale, comparing the full record set.')
+                return None
+            self.log('Error attempting to update the RecordSet instance.')
+            self.fail('Error updating the RecordSet instance: {0}'.format(str(exc)))
+        return response.as_dict()
+
+    def etag_cache_key(self):
+        return '/'.join([self.subscription_id,
+                         self.resource_group,
+                         self.zone_name,
+                         self.relative_record_set_name,
+                         self.record_type]).lower()
+
+    def load_etag_cache(self):
+        try:
+            with open(self.etag_cache) as cache_file:
+                return json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def read_cached_etag(self):
+        if not self.etag_cache:
+            return None
+        return self.load_etag_cache().get(self.etag_cache_key())
+
+    def write_cached_etag(self, etag):
+        if not self.etag_cache:
+            return
+        cache = self.load_etag_cache()
+        if etag is None:
+            cache.pop(self.etag_cache_key(), None)
+        else:
+            cache[self.etag_cache_key()] = etag
+        # Write to a temporary file first so concurrent forks never read a partial cache.
+        cache_dir = os.path.dirname(os.path.abspath(self.etag_cache))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(cache, cache_file)
+            os.rename(tmp_path, self.etag_cache)
+        except (IOError, OSError) as exc:
+            self.log('Could not write the etag cache: {0}'.format(str(exc)))
+
     def create_update_resource(self):
         try:
             response = self.mgmt_client.record_sets.create_or_update(resource_group_name=self.resource_group,
@@ -1158,7 +1873,10 @@ class AzureRMRecordSet(AzureRMModuleBaseExt):
                                                         relative_record_set_name=self.relative_record_set_name,
                                                         record_type=self.record_type)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the RecordSet instance.')
+            self.fail('Error getting the RecordSet instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -24,13 +24,40 @@ options:
     resource_group:
         description:
             - The name of the resource group.
-        required: true
+            - Required unless I(zones) is specified.
         type: str
     zone_name:
         description:
             - The name of the DNS zone (without a terminating dot).
-        required: true
+            - Required unless I(zones) is specified.
         type: str
+    zones:
+        description:
+            - >-
+                List of zones to query concurrently instead of a single
+                I(resource_group) and I(zone_name). All other options apply to every
+                zone.
+            - >-
+                Results are returned per zone in C(zones). A zone that cannot be read
+                reports its error instead of failing the module.
+        type: list
+        elements: dict
+        suboptions:
+            resource_group:
+                description:
+                    - The name of the resource group.
+                required: true
+                type: str
+            zone_name:
+                description:
+                    - The name of the DNS zone (without a terminating dot).
+                required: true
+                type: str
+    max_workers:
+        description:
+            - The maximum number of zones in I(zones) queried at the same time.
+        type: int
+        default: 10
     relative_record_set_name:
         description:
             - 'The name of the record set, relative to the name of the zone.'
@@ -71,6 +98,73 @@ options:
                 the record set enumerations. If this parameter is specified, Enumeration
                 will return only records that end with .:code:`<recordSetNameSuffix>`
         type: str
+    record_types:
+        description:
+            - Only return record sets of these types.
+            - >-
+                A single type is pushed down to the service and listed by type,
+                otherwise the types are filtered while the zone is listed.
+        type: list
+        elements: str
+        choices:
+            - A
+            - AAAA
+            - CAA
+            - CNAME
+            - MX
+            - NS
+            - PTR
+            - SOA
+            - SRV
+            - TXT
+    min_ttl:
+        description:
+            - Only return record sets with a TTL greater than or equal to this value.
+        type: int
+    max_ttl:
+        description:
+            - Only return record sets with a TTL less than or equal to this value.
+        type: int
+    has_target_resource:
+        description:
+            - >-
+                When C(true) only return alias record sets that reference a target
+                resource, when C(false) only return record sets that do not.
+        type: bool
+    zone_file:
+        description:
+            - >-
+                Write the matching record sets to this path in RFC 1035 zone file format
+                instead of returning them. Record sets are written page by page as they
+                are listed.
+            - >-
+                Alias record sets, which reference a target resource, cannot be
+                expressed in a zone file and are written as comments.
+        type: path
+    snapshot:
+        description:
+            - >-
+                Path of a local JSON file holding the name, type and etag of every record
+                set seen by the previous run.
+            - >-
+                When specified, only record sets that were added, modified or removed
+                since the previous run are returned in C(changes), and the file is
+                updated. Record sets whose etag did not change are not converted or
+                returned.
+            - Cannot be combined with I(max_items), I(page_limit) or I(zone_file).
+        type: path
+    max_items:
+        description:
+            - >-
+                The maximum number of record sets to return. Paging stops as soon as
+                this many record sets have been read.
+        type: int
+    page_limit:
+        description:
+            - >-
+                The maximum number of result pages to fetch. Use together with I(top)
+                to bound the size of each page.
+        type: int
 extends_documentation_fragment:
     - azure.azcollection.azure
     - azure.azcollection.azure_tags
@@ -215,6 +309,43 @@ EXAMPLES = '''
         resource_group_name: rg1
         zone_name: zone1
 
+    - name: List alias A and AAAA recordsets under a suffix
+      azure_rm_recordset_info:
+        resource_group: rg1
+        zone_name: zone1
+        record_set_name_suffix: prod
+        record_types:
+          - A
+          - AAAA
+        has_target_resource: true
+
+    - name: List CNAME recordsets of several zones
+      azure_rm_recordset_info:
+        zones:
+          - resource_group: rg1
+            zone_name: zone1
+          - resource_group: rg2
+            zone_name: zone2
+        record_type: CNAME
+
+    - name: Report record sets changed since the previous run
+      azure_rm_recordset_info:
+        resource_group: rg1
+        zone_name: zone1
+        snapshot: /var/lib/dns-drift/snapshot.json
+
+    - name: Export a zone to a zone file
+      azure_rm_recordset_info:
+        resource_group: rg1
+        zone_name: contoso.com
+        zone_file: /tmp/contoso.com.zone
+
+    - name: List the first 500 recordsets of a zone
+      azure_rm_recordset_info:
+        resource_group: rg1
+        zone_name: zone1
+        max_items: 500
+
 '''
 
 RETURN = '''
@@ -665,30 +796,168 @@ record_sets:
                 - The continuation token for the next page of results.
             type: str
             sample: null
+zones:
+    description:
+        - The record sets of each zone in I(zones).
+    returned: when I(zones) is specified
+    type: list
+    contains:
+        resource_group:
+            description:
+                - The name of the resource group.
+            type: str
+            sample: rg1
+        zone_name:
+            description:
+                - The name of the DNS zone.
+            type: str
+            sample: zone1
+        record_sets:
+            description:
+                - The record sets of the zone, in the same format as C(record_sets).
+            returned: when the zone could be read
+            type: list
+        error:
+            description:
+                - The error returned while reading the zone.
+            returned: when the zone could not be read
+            type: str
+changes:
+    description:
+        - The record sets changed since the previous run.
+        - With I(zones), returned for each zone instead of C(record_sets).
+    returned: when I(snapshot) is specified
+    type: complex
+    contains:
+        added:
+            description:
+                - Record sets not present in the previous snapshot, in the same format as C(record_sets).
+            type: list
+        modified:
+            description:
+                - Record sets whose etag changed, in the same format as C(record_sets).
+            type: list
+        removed:
+            description:
+                - Record sets present in the previous snapshot that no longer exist.
+            type: list
+            contains:
+                name:
+                    description:
+                        - The name of the record set.
+                    type: str
+                    sample: www
+                type:
+                    description:
+                        - The type of DNS record in the record set.
+                    type: str
+                    sample: A
+exported:
+    description:
+        - The number of record sets written to I(zone_file).
+    returned: when I(zone_file) is specified
+    type: int
+    sample: 42
 
 '''
 
+import json
+import os
+import tempfile
+from itertools import islice
+from multiprocessing.pool import ThreadPool
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBase
 try:
     from msrestazure.azure_exceptions import CloudError
     from azure.mgmt.dns import DnsManagementClient
     from msrestazure.azure_operation import AzureOperationPoller
     from msrest.polling import LROPoller
+    from msrest.exceptions import ClientRequestError
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
+def fqdn(name):
+    return name if name.endswith('.') else name + '.'
+
+
+def quote(value):
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def soa_zone_file_data(soa_record):
+    if not soa_record:
+        return []
+    return ['{0} {1} {2} {3} {4} {5} {6}'.format(fqdn(soa_record['host']),
+                                                 fqdn(soa_record['email']),
+                                                 soa_record['serial_number'],
+                                                 soa_record['refresh_time'],
+                                                 soa_record['retry_time'],
+                                                 soa_record['expire_time'],
+                                                 soa_record['minimum_ttl'])]
+
+
+# Renders the records of one record set, as returned by as_dict(), into the
+# record data of its zone file entries.
+ZONE_FILE_DATA = {
+    'A': lambda record_set: [record['ipv4_address'] for record in record_set.get('a_records') or []],
+    'AAAA': lambda record_set: [record['ipv6_address'] for record in record_set.get('aaaa_records') or []],
+    'CAA': lambda record_set: ['{0} {1} {2}'.format(record['flags'], record['tag'], quote(record['value']))
+                               for record in record_set.get('caa_records') or []],
+    'CNAME': lambda record_set: [fqdn(record_set['cname_record']['cname'])] if record_set.get('cname_record') else [],
+    'MX': lambda record_set: ['{0} {1}'.format(record['preference'], fqdn(record['exchange']))
+                              for record in record_set.get('mx_records') or []],
+    'NS': lambda record_set: [fqdn(record['nsdname']) for record in record_set.get('ns_records') or []],
+    'PTR': lambda record_set: [fqdn(record['ptrdname']) for record in record_set.get('ptr_records') or []],
+    'SOA': lambda record_set: soa_zone_file_data(record_set.get('soa_record')),
+    'SRV': lambda record_set: ['{0} {1} {2} {3}'.format(record['priority'], record['weight'], record['port'],
+                                                        fqdn(record['target']))
+                               for record in record_set.get('srv_records') or []],
+    'TXT': lambda record_set: [' '.join(quote(value) for value in record['value'])
+                               for record in record_set.get('txt_records') or []],
+}
+
+
+def zone_file_lines(record_set):
+    name = record_set['name']
+    record_type = record_set['type'].split('/')[-1]
+    target_resource = record_set.get('target_resource') or {}
+    if target_resource.get('id'):
+        return ['; {0} {1} is an alias of {2}'.format(name, record_type, target_resource['id'])]
+    prefix = name
+    if record_set.get('ttl') is not None:
+        prefix += ' {0}'.format(record_set['ttl'])
+    prefix += ' IN {0} '.format(record_type)
+    return [prefix + data for data in ZONE_FILE_DATA[record_type](record_set)]
+
+
 class AzureRMRecordSetInfo(AzureRMModuleBase):
     def __init__(self):
         self.module_arg_spec = dict(
             resource_group=dict(
-                type='str',
-                required=True
+                type='str'
             ),
             zone_name=dict(
-                type='str',
-                required=True
+                type='str'
+            ),
+            zones=dict(
+                type='list',
+                elements='dict',
+                options=dict(
+                    resource_group=dict(
+                        type='str',
+                        required=True
+                    ),
+                    zone_name=dict(
+                        type='str',
+                        required=True
+                    )
+                )
+            ),
+            max_workers=dict(
+                type='int',
+                default=10
             ),
             relative_record_set_name=dict(
                 type='str'
@@ -714,16 +983,62 @@ class AzureRMRecordSetInfo(AzureRMModuleBase):
             ),
             record_set_name_suffix=dict(
                 type='str'
+            ),
+            record_types=dict(
+                type='list',
+                elements='str',
+                choices=['A',
+                         'AAAA',
+                         'CAA',
+                         'CNAME',
+                         'MX',
+                         'NS',
+                         'PTR',
+                         'SOA',
+                         'SRV',
+                         'TXT']
+            ),
+            min_ttl=dict(
+                type='int'
+            ),
+            max_ttl=dict(
+                type='int'
+            ),
+            has_target_resource=dict(
+                type='bool'
+            ),
+            zone_file=dict(
+                type='path'
+            ),
+            snapshot=dict(
+                type='path'
+            ),
+            max_items=dict(
+                type='int'
+            ),
+            page_limit=dict(
+                type='int'
             )
         )
 
         self.resource_group = None
         self.zone_name = None
+        self.zones = None
+        self.max_workers = None
         self.relative_record_set_name = None
         self.record_type = None
         self.top = None
         self.recordsetnamesuffix = None
         self.record_set_name_suffix = None
+        self.record_types = None
+        self.min_ttl = None
+        self.max_ttl = None
+        self.has_target_resource = None
+        self.zone_file = None
+        self.snapshot = None
+        self.snapshots = {}
+        self.max_items = None
+        self.page_limit = None
 
         self.results = dict(changed=False)
         self.mgmt_client = None
@@ -737,7 +1052,15 @@ class AzureRMRecordSetInfo(AzureRMModuleBase):
         self.header_parameters['Content-Type'] = 'application/json; charset=utf-8'
 
         self.mgmt_client = None
-        super(AzureRMRecordSetInfo, self).__init__(self.module_arg_spec, supports_tags=True)
+        super(AzureRMRecordSetInfo, self).__init__(self.module_arg_spec,
+                                                   supports_tags=True,
+                                                   mutually_exclusive=[['zone_name', 'zones'],
+                                                                       ['zone_file', 'zones'],
+                                                                       ['snapshot', 'zone_file'],
+                                                                       ['snapshot', 'max_items'],
+                                                                       ['snapshot', 'page_limit']],
+                                                   required_one_of=[['zone_name', 'zones']],
+                                                   required_together=[['resource_group', 'zone_name']])
 
     def exec_module(self, **kwargs):
 
@@ -748,85 +1071,222 @@ class AzureRMRecordSetInfo(AzureRMModuleBase):
                                                     base_url=self._cloud_environment.endpoints.resource_manager,
                                                     api_version='2018-05-01')
 
-        if (self.resource_group is not None and
-            self.zone_name is not None and
-            self.relative_record_set_name is not None and
-            self.record_type is not None):
-            self.results['record_sets'] = self.format_item(self.get())
-        elif (self.resource_group is not None and
-              self.zone_name is not None and
-              self.record_type is not None):
-            self.results['record_sets'] = self.format_item(self.list_by_type())
-        elif (self.resource_group is not None and
-              self.zone_name is not None):
-            self.results['record_sets'] = self.format_item(self.list_by_dns_zone())
-        elif (self.resource_group is not None and
-              self.zone_name is not None):
-            self.results['record_sets'] = self.format_item(self.list_all_by_dns_zone())
-        return self.results
+        if (self.record_type is None and
+            self.relative_record_set_name is None and
+            self.record_types is not None and
+            len(self.record_types) == 1):
+            self.record_type = self.record_types[0]
+
+        if self.snapshot is not None:
+            self.snapshots = self.load_snapshot()
+
+        if self.zones is not None:
+            self.results['zones'] = self.query_zones()
+            return self.results
 
-    def get(self):
         response = None
+        try:
+            response = self.query_zone(self.resource_group, self.zone_name)
+        except CloudError as e:
+            if self.snapshot is not None:
+                self.fail('Error reading zone {0}: {1}'.format(self.zone_name, str(e)))
+            self.log('Could not get info for RecordSet.')
+
+        if self.zone_file is not None:
+            self.results['exported'] = self.export_zone_file(response)
+            return self.results
 
+        # Pages are fetched while iterating, so listing errors only surface here.
         try:
-            response = self.mgmt_client.record_sets.get(resource_group_name=self.resource_group,
-                                                        zone_name=self.zone_name,
-                                                        relative_record_set_name=self.relative_record_set_name,
-                                                        record_type=self.record_type)
+            if self.snapshot is not None:
+                key = self.snapshot_key(self.resource_group, self.zone_name)
+                self.results['changes'], self.snapshots[key] = self.diff_snapshot(response, self.snapshots.get(key, {}))
+            else:
+                self.results['record_sets'] = self.format_item(response)
         except CloudError as e:
-            self.log('Could not get info for @(Model.ModuleOperationNameUpper).')
+            self.fail('Error reading zone {0}: {1}'.format(self.zone_name, str(e)))
+        if self.snapshot is not None:
+            self.save_snapshot()
+        return self.results
 
-        return response
+    def query_zone(self, resource_group, zone_name):
+        if (self.relative_record_set_name is not None and
+            self.record_type is not None):
+            return self.get(resource_group, zone_name)
+        elif self.record_type is not None:
+            return self.list_by_type(resource_group, zone_name)
+        elif self.record_set_name_suffix is not None:
+            return self.list_all_by_dns_zone(resource_group, zone_name)
+        return self.list_by_dns_zone(resource_group, zone_name)
 
-    def list_by_type(self):
-        response = None
+    def query_zones(self):
+        # The SDK client is shared by all workers, each zone only costs its own requests.
+        pool = ThreadPool(max(1, min(self.max_workers, len(self.zones))))
+        try:
+            results = pool.map(self.query_zone_record_sets, self.zones)
+        finally:
+            pool.close()
+            pool.join()
 
+        if self.snapshot is not None:
+            for result in results:
+                if 'error' not in result:
+                    self.snapshots[self.snapshot_key(result['resource_group'], result['zone_name'])] = result.pop('snapshot')
+            self.save_snapshot()
+        return results
+
+    def query_zone_record_sets(self, zone):
+        result = dict(resource_group=zone['resource_group'],
+                      zone_name=zone['zone_name'])
         try:
-            response = self.mgmt_client.record_sets.list_by_type(resource_group_name=self.resource_group,
-                                                                 zone_name=self.zone_name,
-                                                                 record_type=self.record_type,
-                                                                 top=self.top,
-                                                                 recordsetnamesuffix=self.recordsetnamesuffix)
-        except CloudError as e:
-            self.log('Could not get info for @(Model.ModuleOperationNameUpper).')
+            response = self.query_zone(zone['resource_group'], zone['zone_name'])
+            if self.snapshot is not None:
+                previous = self.snapshots.get(self.snapshot_key(zone['resource_group'], zone['zone_name']), {})
+                result['changes'], result['snapshot'] = self.diff_snapshot(response, previous)
+            else:
+                result['record_sets'] = self.format_item(response)
+        except (CloudError, ClientRequestError) as exc:
+            result['error'] = str(exc)
+        return result
 
-        return response
+    def get(self, resource_group, zone_name):
+        return self.mgmt_client.record_sets.get(resource_group_name=resource_group,
+                                                zone_name=zone_name,
+                                                relative_record_set_name=self.relative_record_set_name,
+                                                record_type=self.record_type)
 
-    def list_by_dns_zone(self):
-        response = None
+    def list_by_type(self, resource_group, zone_name):
+        return self.mgmt_client.record_sets.list_by_type(resource_group_name=resource_group,
+                                                         zone_name=zone_name,
+                                                         record_type=self.record_type,
+                                                         top=self.top,
+                                                         recordsetnamesuffix=self.recordsetnamesuffix or self.record_set_name_suffix)
+
+    def list_by_dns_zone(self, resource_group, zone_name):
+        return self.mgmt_client.record_sets.list_by_dns_zone(resource_group_name=resource_group,
+                                                             zone_name=zone_name,
+                                                             top=self.top,
+                                                             recordsetnamesuffix=self.recordsetnamesuffix)
+
+    def list_all_by_dns_zone(self, resource_group, zone_name):
+        return self.mgmt_client.record_sets.list_all_by_dns_zone(resource_group_name=resource_group,
+                                                                 zone_name=zone_name,
+                                                                 top=self.top,
+                                                                 record_set_name_suffix=self.record_set_name_suffix)
+
+    def format_item(self, item):
+        result = []
+        for tmp in self.iterate_items(item):
+            result.append(tmp.as_dict())
+        return result
 
+    def export_zone_file(self, item):
+        # Write to a temporary file first so a failed listing never leaves a partial zone file.
+        exported = 0
+        tmp_path = None
         try:
-            response = self.mgmt_client.record_sets.list_by_dns_zone(resource_group_name=self.resource_group,
-                                                                     zone_name=self.zone_name,
-                                                                     top=self.top,
-                                                                     recordsetnamesuffix=self.recordsetnamesuffix)
-        except CloudError as e:
-            self.log('Could not get info for @(Model.ModuleOperationNameUpper).')
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.zone_file)))
+            with os.fdopen(fd, 'w') as zone_file:
+                zone_file.write('$ORIGIN {0}.\n'.format(self.zone_name.rstrip('.')))
+                for tmp in self.iterate_items(item):
+                    for line in zone_file_lines(tmp.as_dict()):
+                        zone_file.write(line + '\n')
+                    exported += 1
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+            os.rename(tmp_path, self.zone_file)
+            tmp_path = None
+        except CloudError as exc:
+            self.fail('Error reading zone {0}: {1}'.format(self.zone_name, str(exc)))
+        except (IOError, OSError) as exc:
+            self.fail('Error writing zone file {0}: {1}'.format(self.zone_file, str(exc)))
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return exported
 
-        return response
+    def diff_snapshot(self, item, previous):
+        changes = dict(added=[], modified=[], removed=[])
+        current = {}
+        for tmp in self.iterate_items(item):
+            key = '{0}/{1}'.format(tmp.name, tmp.type.split('/')[-1])
+            current[key] = tmp.etag
+            if key not in previous:
+                changes['added'].append(tmp.as_dict())
+            elif previous[key] != tmp.etag:
+                changes['modified'].append(tmp.as_dict())
+        for key in previous:
+            if key not in current:
+                name, record_type = key.rsplit('/', 1)
+                changes['removed'].append(dict(name=name, type=record_type))
+        return changes, current
 
-    def list_all_by_dns_zone(self):
-        response = None
+    def snapshot_key(self, resource_group, zone_name):
+        # Each combination of filters sees different record sets, so each keeps its own snapshot.
+        filters = ['{0}={1}'.format(key, getattr(self, key))
+                   for key in ['relative_record_set_name', 'record_type', 'record_types', 'recordsetnamesuffix',
+                               'record_set_name_suffix', 'min_ttl', 'max_ttl', 'has_target_resource']
+                   if getattr(self, key) is not None]
+        key = '/'.join([self.subscription_id, resource_group, zone_name])
+        if filters:
+            key += '?' + '&'.join(filters)
+        return key.lower()
 
+    def load_snapshot(self):
         try:
-            response = self.mgmt_client.record_sets.list_all_by_dns_zone(resource_group_name=self.resource_group,
-                                                                         zone_name=self.zone_name,
-                                                                         top=self.top,
-                                                                         record_set_name_suffix=self.record_set_name_suffix)
-        except CloudError as e:
-            self.log('Could not get info for @(Model.ModuleOperationNameUpper).')
+            with open(self.snapshot) as snapshot_file:
+                return json.load(snapshot_file)
+        except (IOError, OSError, ValueError):
+            return {}
 
-        return response
+    def save_snapshot(self):
+        # Write to a temporary file first so an interrupted run never leaves a partial snapshot.
+        snapshot_dir = os.path.dirname(os.path.abspath(self.snapshot))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=snapshot_dir)
+            with os.fdopen(fd, 'w') as snapshot_file:
+                json.dump(self.snapshots, snapshot_file)
+            os.rename(tmp_path, self.snapshot)
+        except (IOError, OSError) as exc:
+            self.fail('Error writing snapshot {0}: {1}'.format(self.snapshot, str(exc)))
 
-    def format_item(self, item):
+    def iterate_items(self, item):
+        if item is None:
+            return iter([])
         if hasattr(item, 'as_dict'):
-            return [item.as_dict()]
+            items = [item]
         else:
-            result = []
-            items = list(item)
-            for tmp in items:
-                result.append(tmp.as_dict())
-            return result
+            items = self.iterate_pages(item)
+        return islice((tmp for tmp in items if self.matches(tmp)), self.max_items)
+
+    def matches(self, item):
+        if self.record_types is not None and item.type.split('/')[-1] not in self.record_types:
+            return False
+        if self.min_ttl is not None and (item.ttl is None or item.ttl < self.min_ttl):
+            return False
+        if self.max_ttl is not None and (item.ttl is None or item.ttl > self.max_ttl):
+            return False
+        if self.has_target_resource is not None:
+            has_target_resource = item.target_resource is not None and item.target_resource.id is not None
+            if has_target_resource != self.has_target_resource:
+                return False
+        return True
+
+    def iterate_pages(self, item):
+        # Paged results only hold the current page, so converting while iterating
+        # never keeps more than one page of SDK objects alive.
+        if self.page_limit is None:
+            for tmp in item:
+                yield tmp
+            return
+        for page_number in range(self.page_limit):
+            try:
+                page = item.advance_page()
+            except StopIteration:
+                return
+            for tmp in page:
+                yield tmp
 
 
 def main():
@@ -1085,10 +1085,6 @@ class AzureRMRecordSet(AzureRMModuleBaseExt):
                                                     base_url=self._cloud_environment.endpoints.resource_manager,
                                                     api_version='2018-05-01')
 
-        if 'location' not in self.body:
-            resource_group = self.get_resource_group(self.resource_group)
-            self.body['location'] = resource_group.location
-
         old_response = self.get_resource()
 
         if not old_response:
@@ -1158,7 +1154,10 @@ class AzureRMRecordSet(AzureRMModuleBaseExt):
                                                         relative_record_set_name=self.relative_record_set_name,
                                                         record_type=self.record_type)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the RecordSet instance.')
+            self.fail('Error getting the RecordSet instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
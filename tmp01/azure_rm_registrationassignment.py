@@ -371,7 +371,10 @@ class AzureRMRegistrationAssignment(AzureRMModuleBaseExt):
                                                                      registration_assignment_id=self.registration_assignment_id,
                                                                      expand_registration_definition=self.expand_registration_definition)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the RegistrationAssignment instance.')
+            self.fail('Error getting the RegistrationAssignment instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -420,7 +420,10 @@ class AzureRMRegistrationDefinition(AzureRMModuleBaseExt):
             response = self.mgmt_client.registration_definitions.get(scope=self.scope,
                                                                      registration_definition_id=self.registration_definition_id)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the RegistrationDefinition instance.')
+            self.fail('Error getting the RegistrationDefinition instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -361,7 +361,10 @@ class AzureRMMarketplaceRegistrationDefinition(AzureRMModuleBaseExt):
             response = self.mgmt_client.marketplace_registration_definitions.get(scope=self.scope,
                                                                                  marketplace_identifier=self.marketplace_identifier)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the MarketplaceRegistrationDefinition instance.')
+            self.fail('Error getting the MarketplaceRegistrationDefinition instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -157,7 +157,10 @@ class AzureRMOperation(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.operations.get()
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the Operation instance.')
+            self.fail('Error getting the Operation instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
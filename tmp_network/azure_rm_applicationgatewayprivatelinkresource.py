@@ -159,7 +159,10 @@ class AzureRMApplicationGatewayPrivateLinkResource(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.application_gateway_private_link_resources.get()
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the ApplicationGatewayPrivateLinkResource instance.')
+            self.fail('Error getting the ApplicationGatewayPrivateLinkResource instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
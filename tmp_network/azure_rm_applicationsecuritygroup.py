@@ -241,7 +241,10 @@ class AzureRMApplicationSecurityGroup(AzureRMModuleBaseExt):
             response = self.mgmt_client.application_security_groups.get(resource_group_name=self.resource_group_name,
                                                                         application_security_group_name=self.application_security_group_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the ApplicationSecurityGroup instance.')
+            self.fail('Error getting the ApplicationSecurityGroup instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
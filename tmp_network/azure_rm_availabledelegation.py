@@ -157,7 +157,10 @@ class AzureRMAvailableDelegation(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.available_delegations.get()
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the AvailableDelegation instance.')
+            self.fail('Error getting the AvailableDelegation instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -157,7 +157,10 @@ class AzureRMAvailableEndpointService(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.available_endpoint_services.get()
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the AvailableEndpointService instance.')
+            self.fail('Error getting the AvailableEndpointService instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
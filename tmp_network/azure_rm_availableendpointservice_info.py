@@ -26,6 +26,37 @@ options:
       - The location to check available endpoint services.
     required: true
     type: str
+  cache:
+    description:
+      - How to use the local cache of query results.
+      - C(bypass) always queries Azure and leaves the cache untouched.
+      - >-
+        C(use) returns the cached result while it is younger than I(cache_ttl),
+        and otherwise queries Azure and caches the result.
+      - C(refresh) always queries Azure and replaces the cached result.
+      - >-
+        Results are cached per subscription, API version and value of every other
+        option of the module.
+    type: str
+    choices:
+      - bypass
+      - use
+      - refresh
+    default: bypass
+  cache_ttl:
+    description:
+      - The number of seconds a cached result is used for.
+    type: int
+    default: 86400
+  cache_dir:
+    description:
+      - >-
+        The directory holding the cached results. Defaults to
+        C(ansible-azure-catalog-cache-<uid>) in the system temporary directory.
+      - >-
+        The cache is only used when the directory belongs to the current user
+        and cannot be written by other users.
+    type: path
 extends_documentation_fragment:
   - azure
 author:
@@ -37,7 +68,11 @@ EXAMPLES = '''
     - name: EndpointServicesList
       azure_rm_availableendpointservice_info: 
         location: westus
-        
+
+    - name: List available endpoint services, queried at most once a day
+      azure_rm_availableendpointservice_info:
+        location: westus
+        cache: use
 
 '''
 
@@ -65,6 +100,12 @@ available_endpoint_services:
 
 '''
 
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import time
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBase
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -76,16 +117,44 @@ except ImportError:
     pass
 
 
+def cache_file_path(cache_dir, key):
+    return os.path.join(cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+
+def cache_dir_is_private(cache_dir):
+    # Another user able to write the directory could plant results, so such a cache is never used.
+    try:
+        info = os.stat(cache_dir)
+    except OSError:
+        return False
+    return stat.S_ISDIR(info.st_mode) and info.st_uid == os.getuid() and not info.st_mode & 0o022
+
+
 class AzureRMAvailableEndpointServiceInfo(AzureRMModuleBase):
     def __init__(self):
         self.module_arg_spec = dict(
             location=dict(
                 type='str',
                 required=True
+            ),
+            cache=dict(
+                type='str',
+                choices=['bypass', 'use', 'refresh'],
+                default='bypass'
+            ),
+            cache_ttl=dict(
+                type='int',
+                default=86400
+            ),
+            cache_dir=dict(
+                type='path'
             )
         )
 
         self.location = None
+        self.cache = None
+        self.cache_ttl = None
+        self.cache_dir = None
 
         self.results = dict(changed=False)
         self.mgmt_client = None
@@ -110,8 +179,16 @@ class AzureRMAvailableEndpointServiceInfo(AzureRMModuleBase):
                                                     base_url=self._cloud_environment.endpoints.resource_manager,
                                                     api_version='2020-07-01')
 
-        if (self.location is not None):
-            self.results['available_endpoint_services'] = self.format_item(self.list())
+        if self.cache_dir is None:
+            self.cache_dir = os.path.join(tempfile.gettempdir(), 'ansible-azure-catalog-cache-{0}'.format(os.getuid()))
+
+        items = self.read_cache() if self.cache == 'use' else None
+        if items is None:
+            if (self.location is not None):
+                items = self.format_item(self.list())
+            if self.cache != 'bypass':
+                self.write_cache(items)
+        self.results['available_endpoint_services'] = items
         return self.results
 
     def list(self):
@@ -124,6 +201,39 @@ class AzureRMAvailableEndpointServiceInfo(AzureRMModuleBase):
 
         return response
 
+    def cache_key(self):
+        query = ['{0}={1}'.format(key, getattr(self, key))
+                 for key in sorted(self.module_arg_spec)
+                 if key not in ('cache', 'cache_ttl', 'cache_dir') and getattr(self, key) is not None]
+        return '/'.join(['azure_rm_availableendpointservice_info', self.subscription_id, self.query_parameters['api-version']] + query).lower()
+
+    def read_cache(self):
+        if not cache_dir_is_private(self.cache_dir):
+            return None
+        try:
+            with open(cache_file_path(self.cache_dir, self.cache_key())) as cache_file:
+                entry = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+        if entry.get('key') != self.cache_key() or time.time() - entry.get('timestamp', 0) > self.cache_ttl:
+            return None
+        return entry.get('items')
+
+    def write_cache(self, items):
+        # A cache that cannot be written only costs the next run a query, so this never fails the module.
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir, 0o700)
+            if not cache_dir_is_private(self.cache_dir):
+                self.log('Not writing cache in {0}, it is not private to the current user.'.format(self.cache_dir))
+                return
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(dict(key=self.cache_key(), timestamp=time.time(), items=items), cache_file)
+            os.rename(tmp_path, cache_file_path(self.cache_dir, self.cache_key()))
+        except (IOError, OSError) as exc:
+            self.log('Could not write cache in {0}: {1}'.format(self.cache_dir, str(exc)))
+
     def format_item(self, item):
         if hasattr(item, 'as_dict'):
             return [item.as_dict()]
@@ -159,7 +159,10 @@ class AzureRMAvailableResourceGroupDelegation(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.available_resource_group_delegations.get()
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the AvailableResourceGroupDelegation instance.')
+            self.fail('Error getting the AvailableResourceGroupDelegation instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
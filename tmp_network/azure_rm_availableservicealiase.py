@@ -157,7 +157,10 @@ class AzureRMAvailableServiceAliase(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.available_service_aliases.get()
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the AvailableServiceAliase instance.')
+            self.fail('Error getting the AvailableServiceAliase instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -157,7 +157,10 @@ class AzureRMAzureFirewallFqdnTag(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.azure_firewall_fqdn_tags.get()
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the AzureFirewallFqdnTag instance.')
+            self.fail('Error getting the AzureFirewallFqdnTag instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -374,7 +374,10 @@ class AzureRMBastionHost(AzureRMModuleBaseExt):
             response = self.mgmt_client.bastion_hosts.get(resource_group_name=self.resource_group_name,
                                                           bastion_host_name=self.bastion_host_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the BastionHost instance.')
+            self.fail('Error getting the BastionHost instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
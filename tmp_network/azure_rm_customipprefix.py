@@ -349,7 +349,10 @@ class AzureRMCustomIPPrefix(AzureRMModuleBaseExt):
                                                               custom_ip_prefix_name=self.custom_ip_prefix_name,
                                                               expand=self.expand)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the CustomIPPrefix instance.')
+            self.fail('Error getting the CustomIPPrefix instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
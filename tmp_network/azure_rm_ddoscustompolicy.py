@@ -386,7 +386,10 @@ class AzureRMDdosCustomPolicy(AzureRMModuleBaseExt):
             response = self.mgmt_client.ddos_custom_policies.get(resource_group_name=self.resource_group_name,
                                                                  ddos_custom_policy_name=self.ddos_custom_policy_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the DdosCustomPolicy instance.')
+            self.fail('Error getting the DdosCustomPolicy instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -287,7 +287,10 @@ class AzureRMDdosProtectionPlan(AzureRMModuleBaseExt):
             response = self.mgmt_client.ddos_protection_plans.get(resource_group_name=self.resource_group_name,
                                                                   ddos_protection_plan_name=self.ddos_protection_plan_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the DdosProtectionPlan instance.')
+            self.fail('Error getting the DdosProtectionPlan instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
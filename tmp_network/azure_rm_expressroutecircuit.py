@@ -439,6 +439,16 @@ options:
     choices:
       - absent
       - present
+  wait:
+    description:
+      - How long to wait for the create, update or delete operation to finish.
+      - C(true) waits until the operation completes, C(false) returns as soon as
+        the request has been accepted, and a number waits at most that many seconds.
+      - >-
+        When the operation is still running the module returns
+        C(operation_status), use M(azure_rm_expressroutecircuit_info) to poll C(provisioning_state).
+    type: raw
+    default: true
 extends_documentation_fragment:
   - azure
 author:
@@ -486,7 +496,21 @@ EXAMPLES = '''
           family: MeteredData
           name: Premium_MeteredData
           tier: Premium
-        
+
+    - name: Start updates of several ExpressRouteCircuit instances without waiting
+      azure_rm_expressroutecircuit:
+        resource_group_name: rg1
+        circuit_name: "{{ item }}"
+        wait: false
+      loop: "{{ names }}"
+
+    - name: Wait until every ExpressRouteCircuit in the resource group has finished updating
+      azure_rm_expressroutecircuit_info:
+        resource_group_name: rg1
+      register: output
+      until: output.express_route_circuits | selectattr('provisioning_state', 'equalto', 'Updating') | list | length == 0
+      retries: 120
+      delay: 30
 
 '''
 
@@ -1063,9 +1087,18 @@ global_reach_enabled:
   returned: always
   type: bool
   sample: null
+operation_status:
+  description:
+    - >-
+      Status of the long running operation when it had not finished within
+      I(wait).
+  returned: when the operation is still running
+  type: str
+  sample: InProgress
 
 '''
 
+from ansible.module_utils.parsing.convert_bool import boolean
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBaseExt
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -1476,11 +1509,17 @@ class AzureRMExpressRouteCircuit(AzureRMModuleBaseExt):
                 type='str',
                 default='present',
                 choices=['present', 'absent']
+            ),
+            wait=dict(
+                type='raw',
+                default=True
             )
         )
 
         self.resource_group_name = None
         self.circuit_name = None
+        self.wait = None
+        self.wait_seconds = None
         self.body = {}
 
         self.results = dict(changed=False)
@@ -1500,6 +1539,7 @@ class AzureRMExpressRouteCircuit(AzureRMModuleBaseExt):
                 self.body[key] = kwargs[key]
 
         self.inflate_parameters(self.module_arg_spec, self.body, 0)
+        self.wait_seconds = self.wait_timeout()
 
         old_response = None
         response = None
@@ -1546,28 +1586,59 @@ class AzureRMExpressRouteCircuit(AzureRMModuleBaseExt):
                                                                                 circuit_name=self.circuit_name,
                                                                                 parameters=self.body)
             if isinstance(response, AzureOperationPoller) or isinstance(response, LROPoller):
-                response = self.get_poller_result(response)
+                response = self.wait_for_poller(response)
         except CloudError as exc:
             self.log('Error attempting to create the ExpressRouteCircuit instance.')
             self.fail('Error creating the ExpressRouteCircuit instance: {0}'.format(str(exc)))
-        return response.as_dict()
+        return response.as_dict() if response else None
 
     def delete_resource(self):
         try:
             response = self.mgmt_client.express_route_circuits.delete(resource_group_name=self.resource_group_name,
                                                                       circuit_name=self.circuit_name)
+            if isinstance(response, AzureOperationPoller) or isinstance(response, LROPoller):
+                self.wait_for_poller(response)
         except CloudError as e:
             self.log('Error attempting to delete the ExpressRouteCircuit instance.')
             self.fail('Error deleting the ExpressRouteCircuit instance: {0}'.format(str(e)))
 
         return True
 
+    def wait_for_poller(self, poller):
+        timeout = self.wait_seconds
+        if timeout is None:
+            return self.get_poller_result(poller)
+        if timeout > 0:
+            poller.wait(timeout=timeout)
+        if poller.done():
+            return poller.result()
+        self.results['operation_status'] = poller.status()
+        return None
+
+    def wait_timeout(self):
+        # None waits until the operation is done, otherwise the number of seconds to wait.
+        if isinstance(self.wait, bool):
+            return None if self.wait else 0
+        try:
+            timeout = int(self.wait)
+        except (TypeError, ValueError):
+            try:
+                return None if boolean(self.wait) else 0
+            except TypeError:
+                timeout = -1
+        if timeout < 0:
+            self.fail('wait must be a boolean or a non-negative number of seconds, got {0}'.format(self.wait))
+        return timeout
+
     def get_resource(self):
         try:
             response = self.mgmt_client.express_route_circuits.get(resource_group_name=self.resource_group_name,
                                                                    circuit_name=self.circuit_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the ExpressRouteCircuit instance.')
+            self.fail('Error getting the ExpressRouteCircuit instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
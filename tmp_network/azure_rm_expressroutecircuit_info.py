@@ -34,6 +34,56 @@ options:
     description:
       - The name of the peering.
     type: str
+  fields:
+    description:
+      - >-
+        Only return these attributes of each ExpressRouteCircuit. Use dotted paths for nested
+        attributes, for example C(peerings.peering_type); paths
+        continue through lists element by element.
+      - When not specified, the complete ExpressRouteCircuit is returned.
+    type: list
+    elements: str
+  stats:
+    description:
+      - >-
+        Circuits and peerings to read the traffic counters of, instead of
+        returning circuits.
+      - >-
+        All entries are queried concurrently and returned in C(stats) as one
+        compact record each.
+    type: list
+    elements: dict
+    suboptions:
+      resource_group_name:
+        description:
+          - The name of the resource group.
+        type: str
+        required: true
+      circuit_name:
+        description:
+          - The name of the express route circuit.
+        type: str
+        required: true
+      peering_name:
+        description:
+          - >-
+            The name of the peering. When not specified, the counters of the whole
+            circuit are returned.
+        type: str
+  stats_state:
+    description:
+      - >-
+        Path of a local JSON file holding the counters of the previous run of
+        I(stats).
+      - >-
+        When specified, every record also contains the change of each counter
+        since that sample and the seconds elapsed, and the file is updated.
+    type: path
+  max_workers:
+    description:
+      - The maximum number of entries in I(stats) queried at the same time.
+    type: int
+    default: 10
 extends_documentation_fragment:
   - azure
 author:
@@ -49,10 +99,10 @@ EXAMPLES = '''
         
 
     - name: Get ExpressRoute Circuit Traffic Stats
-      azure_rm_expressroutecircuit_info: 
-        circuit_name: circuitName
-        resource_group_name: rg1
-        
+      azure_rm_expressroutecircuit_info:
+        stats:
+          - circuit_name: circuitName
+            resource_group_name: rg1
 
     - name: Get ExpressRoute Circuit Peering Traffic Stats
       azure_rm_expressroutecircuit_info: 
@@ -67,7 +117,25 @@ EXAMPLES = '''
         
 
     - name: List ExpressRouteCircuits in a subscription
-      azure_rm_expressroutecircuit_info: 
+      azure_rm_expressroutecircuit_info:
+
+    - name: List the name and provisioning state of ExpressRouteCircuits in a resource group
+      azure_rm_expressroutecircuit_info:
+        resource_group_name: rg1
+        fields:
+          - id
+          - name
+          - provisioning_state
+
+    - name: Sample the traffic of circuits and peerings since the previous run
+      azure_rm_expressroutecircuit_info:
+        stats:
+          - circuit_name: circuit1
+            resource_group_name: rg1
+          - circuit_name: circuit2
+            peering_name: AzurePrivatePeering
+            resource_group_name: rg1
+        stats_state: /var/lib/circuit-stats/state.json
 
 '''
 
@@ -1228,20 +1296,119 @@ express_route_circuits:
       returned: always
       type: str
       sample: null
+stats:
+  description:
+    - The traffic counters of each entry in I(stats), in the same order.
+  returned: when I(stats) is specified
+  type: list
+  contains:
+    resource_group_name:
+      description:
+        - The name of the resource group.
+      returned: always
+      type: str
+      sample: rg1
+    circuit_name:
+      description:
+        - The name of the express route circuit.
+      returned: always
+      type: str
+      sample: circuit1
+    peering_name:
+      description:
+        - The name of the peering, null for the whole circuit.
+      returned: always
+      type: str
+      sample: AzurePrivatePeering
+    timestamp:
+      description:
+        - The time the counters were read, in seconds since the epoch.
+      returned: when the counters could be read
+      type: float
+      sample: 1602979200.0
+    counters:
+      description:
+        - >-
+          The C(primarybytes_in), C(primarybytes_out), C(secondarybytes_in) and
+          C(secondarybytes_out) counters.
+      returned: when the counters could be read
+      type: dict
+      sample: {"primarybytes_in": 1024, "primarybytes_out": 2048,
+               "secondarybytes_in": 0, "secondarybytes_out": 0}
+    deltas:
+      description:
+        - >-
+          The change of each counter since the sample in I(stats_state). A counter
+          that went down, for example after a reset, has a null delta.
+      returned: when I(stats_state) holds a previous sample of this entry
+      type: dict
+      sample: {"primarybytes_in": 512, "primarybytes_out": 128,
+               "secondarybytes_in": 0, "secondarybytes_out": 0}
+    interval:
+      description:
+        - The seconds elapsed since the sample in I(stats_state).
+      returned: when I(stats_state) holds a previous sample of this entry
+      type: float
+      sample: 60.2
+    error:
+      description:
+        - The error returned when the counters could not be read.
+      returned: when the counters could not be read
+      type: str
 
 '''
 
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBase
 try:
     from msrestazure.azure_exceptions import CloudError
     from azure.mgmt.network import NetworkManagementClient
     from msrestazure.azure_operation import AzureOperationPoller
     from msrest.polling import LROPoller
+    from msrest.exceptions import ClientRequestError
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
+def to_plain(value):
+    if hasattr(value, 'as_dict'):
+        return value.as_dict()
+    if isinstance(value, list):
+        return [to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return dict((key, to_plain(item)) for key, item in value.items())
+    return value
+
+
+def project_fields(value, paths):
+    '''
+    Return only the attribute paths of an SDK model, converting just the
+    selected values. Paths continue through lists element by element.
+    '''
+    if isinstance(value, list):
+        return [project_fields(item, paths) for item in value]
+    if [] in paths or not (hasattr(value, 'as_dict') or isinstance(value, dict)):
+        return to_plain(value)
+    result = {}
+    children = OrderedDict()
+    for path in paths:
+        children.setdefault(path[0], []).append(path[1:])
+    for name, child_paths in children.items():
+        child = value.get(name) if isinstance(value, dict) else getattr(value, name, None)
+        if child is not None:
+            result[name] = project_fields(child, child_paths)
+    return result
+
+
+STATS_COUNTERS = ['primarybytes_in', 'primarybytes_out', 'secondarybytes_in', 'secondarybytes_out']
+
+
 class AzureRMExpressRouteCircuitInfo(AzureRMModuleBase):
     def __init__(self):
         self.module_arg_spec = dict(
@@ -1253,12 +1420,44 @@ class AzureRMExpressRouteCircuitInfo(AzureRMModuleBase):
             ),
             peering_name=dict(
                 type='str'
+            ),
+            fields=dict(
+                type='list',
+                elements='str'
+            ),
+            stats=dict(
+                type='list',
+                elements='dict',
+                options=dict(
+                    resource_group_name=dict(
+                        type='str',
+                        required=True
+                    ),
+                    circuit_name=dict(
+                        type='str',
+                        required=True
+                    ),
+                    peering_name=dict(
+                        type='str'
+                    )
+                )
+            ),
+            stats_state=dict(
+                type='path'
+            ),
+            max_workers=dict(
+                type='int',
+                default=10
             )
         )
 
         self.resource_group_name = None
         self.circuit_name = None
         self.peering_name = None
+        self.fields = None
+        self.stats = None
+        self.stats_state = None
+        self.max_workers = None
 
         self.results = dict(changed=False)
         self.mgmt_client = None
@@ -1272,7 +1471,13 @@ class AzureRMExpressRouteCircuitInfo(AzureRMModuleBase):
         self.header_parameters['Content-Type'] = 'application/json; charset=utf-8'
 
         self.mgmt_client = None
-        super(AzureRMExpressRouteCircuitInfo, self).__init__(self.module_arg_spec, supports_tags=True)
+        mutually_exclusive = [['stats', 'resource_group_name'],
+                              ['stats', 'circuit_name'],
+                              ['stats', 'peering_name'],
+                              ['stats', 'fields']]
+        super(AzureRMExpressRouteCircuitInfo, self).__init__(self.module_arg_spec,
+                                                             mutually_exclusive=mutually_exclusive,
+                                                             supports_tags=True)
 
     def exec_module(self, **kwargs):
 
@@ -1283,16 +1488,15 @@ class AzureRMExpressRouteCircuitInfo(AzureRMModuleBase):
                                                     base_url=self._cloud_environment.endpoints.resource_manager,
                                                     api_version='2020-07-01')
 
-        if (self.resource_group_name is not None and
-            self.circuit_name is not None and
-            self.peering_name is not None):
+        if self.stats is not None:
+            self.results['stats'] = self.sample_stats()
+        elif (self.resource_group_name is not None and
+              self.circuit_name is not None and
+              self.peering_name is not None):
             self.results['express_route_circuits'] = self.format_item(self.get_peering_stats())
         elif (self.resource_group_name is not None and
               self.circuit_name is not None):
             self.results['express_route_circuits'] = self.format_item(self.get())
-        elif (self.resource_group_name is not None and
-              self.circuit_name is not None):
-            self.results['express_route_circuits'] = self.format_item(self.get_stats())
         elif (self.resource_group_name is not None):
             self.results['express_route_circuits'] = self.format_item(self.list())
         else:
@@ -1322,17 +1526,6 @@ class AzureRMExpressRouteCircuitInfo(AzureRMModuleBase):
 
         return response
 
-    def get_stats(self):
-        response = None
-
-        try:
-            response = self.mgmt_client.express_route_circuits.get_stats(resource_group_name=self.resource_group_name,
-                                                                         circuit_name=self.circuit_name)
-        except CloudError as e:
-            self.log('Could not get info for @(Model.ModuleOperationNameUpper).')
-
-        return response
-
     def list(self):
         response = None
 
@@ -1353,15 +1546,91 @@ class AzureRMExpressRouteCircuitInfo(AzureRMModuleBase):
 
         return response
 
+    def sample_stats(self):
+        pool = ThreadPool(max(1, min(self.max_workers, len(self.stats))))
+        try:
+            records = pool.map(self.read_stats, self.stats)
+        finally:
+            pool.close()
+            pool.join()
+
+        if self.stats_state is not None:
+            state = self.load_stats_state()
+            for record in records:
+                if 'error' in record:
+                    continue
+                key = self.stats_key(record)
+                previous = state.get(key)
+                if previous is not None:
+                    record['deltas'] = dict((counter, self.counter_delta(previous['counters'].get(counter), record['counters'][counter]))
+                                            for counter in STATS_COUNTERS)
+                    record['interval'] = record['timestamp'] - previous['timestamp']
+                state[key] = dict(timestamp=record['timestamp'], counters=record['counters'])
+            self.save_stats_state(state)
+        return records
+
+    def read_stats(self, entry):
+        record = dict(resource_group_name=entry['resource_group_name'],
+                      circuit_name=entry['circuit_name'],
+                      peering_name=entry['peering_name'])
+        try:
+            if entry['peering_name'] is not None:
+                response = self.mgmt_client.express_route_circuits.get_peering_stats(resource_group_name=entry['resource_group_name'],
+                                                                                     circuit_name=entry['circuit_name'],
+                                                                                     peering_name=entry['peering_name'])
+            else:
+                response = self.mgmt_client.express_route_circuits.get_stats(resource_group_name=entry['resource_group_name'],
+                                                                             circuit_name=entry['circuit_name'])
+        except (CloudError, ClientRequestError) as e:
+            record['error'] = str(e)
+            return record
+        record['timestamp'] = time.time()
+        record['counters'] = dict((counter, getattr(response, counter)) for counter in STATS_COUNTERS)
+        return record
+
+    def counter_delta(self, previous, current):
+        if previous is None or current is None or current < previous:
+            return None
+        return current - previous
+
+    def stats_key(self, record):
+        return '/'.join([self.subscription_id,
+                         record['resource_group_name'],
+                         record['circuit_name'],
+                         record['peering_name'] or '']).lower()
+
+    def load_stats_state(self):
+        try:
+            with open(self.stats_state) as state_file:
+                return json.load(state_file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def save_stats_state(self, state):
+        # Write to a temporary file first so an interrupted run never leaves a partial sample.
+        state_dir = os.path.dirname(os.path.abspath(self.stats_state))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=state_dir)
+            with os.fdopen(fd, 'w') as state_file:
+                json.dump(state, state_file)
+            os.rename(tmp_path, self.stats_state)
+        except (IOError, OSError) as exc:
+            self.fail('Error writing stats state {0}: {1}'.format(self.stats_state, str(exc)))
+
     def format_item(self, item):
+        if item is None:
+            return []
         if hasattr(item, 'as_dict'):
-            return [item.as_dict()]
-        else:
-            result = []
-            items = list(item)
-            for tmp in items:
-                result.append(tmp.as_dict())
-            return result
+            return [self.convert_item(item)]
+        result = []
+        for tmp in item:
+            result.append(self.convert_item(tmp))
+        return result
+
+    def convert_item(self, item):
+        if self.fields is None:
+            return item.as_dict()
+        return project_fields(item, [field.split('.') for field in self.fields])
 
 
 def main():
@@ -280,7 +280,10 @@ class AzureRMExpressRouteCircuitAuthorization(AzureRMModuleBaseExt):
                                                                                  circuit_name=self.circuit_name,
                                                                                  authorization_name=self.authorization_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the ExpressRouteCircuitAuthorization instance.')
+            self.fail('Error getting the ExpressRouteCircuitAuthorization instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -402,7 +402,10 @@ class AzureRMExpressRouteCircuitConnection(AzureRMModuleBaseExt):
                                                                               peering_name=self.peering_name,
                                                                               connection_name=self.connection_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the ExpressRouteCircuitConnection instance.')
+            self.fail('Error getting the ExpressRouteCircuitConnection instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -1138,7 +1138,10 @@ class AzureRMExpressRouteCircuitPeering(AzureRMModuleBaseExt):
                                                                            circuit_name=self.circuit_name,
                                                                            peering_name=self.peering_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the ExpressRouteCircuitPeering instance.')
+            self.fail('Error getting the ExpressRouteCircuitPeering instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
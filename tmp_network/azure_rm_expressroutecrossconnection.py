@@ -772,7 +772,10 @@ class AzureRMExpressRouteCrossConnection(AzureRMModuleBaseExt):
             response = self.mgmt_client.express_route_cross_connections.get(resource_group_name=self.resource_group_name,
                                                                             cross_connection_name=self.cross_connection_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the ExpressRouteCrossConnection instance.')
+            self.fail('Error getting the ExpressRouteCrossConnection instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
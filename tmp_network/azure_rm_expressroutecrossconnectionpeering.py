@@ -661,7 +661,10 @@ class AzureRMExpressRouteCrossConnectionPeering(AzureRMModuleBaseExt):
                                                                                     cross_connection_name=self.cross_connection_name,
                                                                                     peering_name=self.peering_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the ExpressRouteCrossConnectionPeering instance.')
+            self.fail('Error getting the ExpressRouteCrossConnectionPeering instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -280,7 +280,10 @@ class AzureRMExpressRouteLink(AzureRMModuleBaseExt):
                                                                 express_route_port_name=self.express_route_port_name,
                                                                 link_name=self.link_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the ExpressRouteLink instance.')
+            self.fail('Error getting the ExpressRouteLink instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
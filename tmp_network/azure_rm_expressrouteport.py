@@ -578,7 +578,10 @@ class AzureRMExpressRoutePort(AzureRMModuleBaseExt):
             response = self.mgmt_client.express_route_ports.get(resource_group_name=self.resource_group_name,
                                                                 express_route_port_name=self.express_route_port_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the ExpressRoutePort instance.')
+            self.fail('Error getting the ExpressRoutePort instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
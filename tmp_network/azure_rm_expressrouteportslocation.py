@@ -219,7 +219,10 @@ class AzureRMExpressRoutePortsLocation(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.express_route_ports_locations.get(location_name=self.location_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the ExpressRoutePortsLocation instance.')
+            self.fail('Error getting the ExpressRoutePortsLocation instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -157,7 +157,10 @@ class AzureRMExpressRouteServiceProvider(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.express_route_service_providers.get()
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the ExpressRouteServiceProvider instance.')
+            self.fail('Error getting the ExpressRouteServiceProvider instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
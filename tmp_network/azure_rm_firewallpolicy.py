@@ -967,7 +967,10 @@ class AzureRMFirewallPolicy(AzureRMModuleBaseExt):
                                                               firewall_policy_name=self.firewall_policy_name,
                                                               expand=self.expand)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the FirewallPolicy instance.')
+            self.fail('Error getting the FirewallPolicy instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -26,17 +26,17 @@ options:
   resource_group_name:
     description:
       - The name of the resource group.
-    required: true
+      - Required unless I(rule_collection_groups) is specified.
     type: str
   firewall_policy_name:
     description:
       - The name of the Firewall Policy.
-    required: true
+      - Required unless I(rule_collection_groups) is specified.
     type: str
   rule_collection_group_name:
     description:
       - The name of the FirewallPolicyRuleCollectionGroup.
-    required: true
+      - Required unless I(rule_collection_groups) is specified.
     type: str
   name:
     description:
@@ -47,10 +47,14 @@ options:
   priority:
     description:
       - Priority of the Firewall Policy Rule Collection Group resource.
-    type: integer
+    type: int
   rule_collections:
     description:
       - Group of Firewall Policy rule collections.
+      - >-
+        Rule collections, and the rules of each collection, are compared with the
+        existing ones by name, so a different order alone is not a change. All
+        changed rule collections are written in one update of the group.
     type: list
     suboptions:
       rule_collection_type:
@@ -68,7 +72,18 @@ options:
       priority:
         description:
           - Priority of the Firewall Policy Rule Collection resource.
-        type: integer
+        type: int
+      action:
+        description:
+          - The action type of the rule collection, for example C(type: Allow).
+        type: dict
+      rules:
+        description:
+          - >-
+            List of rules of the rule collection, each with a unique I(name) and a
+            I(rule_type) of C(ApplicationRule), C(NetworkRule) or C(NatRule).
+        type: list
+        elements: dict
   state:
     description:
       - Assert the state of the FirewallPolicyRuleCollectionGroup.
@@ -79,6 +94,64 @@ options:
     choices:
       - absent
       - present
+  rule_collection_groups:
+    description:
+      - >-
+        List of rule collection groups to apply in one run, instead of a single
+        I(rule_collection_group_name). The groups may belong to different
+        firewall policies.
+      - >-
+        All groups are read concurrently. Azure accepts one write per firewall
+        policy at a time, so the changes of each policy are written one after
+        the other, deletes first and then by priority. Different policies are
+        written concurrently.
+      - >-
+        When a write fails, the remaining changes of that policy are skipped,
+        the other policies are still applied, and the module fails afterwards.
+    type: list
+    elements: dict
+    suboptions:
+      resource_group_name:
+        description:
+          - The name of the resource group.
+        required: true
+        type: str
+      firewall_policy_name:
+        description:
+          - The name of the Firewall Policy.
+        required: true
+        type: str
+      rule_collection_group_name:
+        description:
+          - The name of the FirewallPolicyRuleCollectionGroup.
+        required: true
+        type: str
+      priority:
+        description:
+          - Priority of the Firewall Policy Rule Collection Group resource.
+        type: int
+      rule_collections:
+        description:
+          - >-
+            Group of Firewall Policy rule collections, see I(rule_collections).
+        type: list
+        elements: dict
+      state:
+        description:
+          - Assert the state of the FirewallPolicyRuleCollectionGroup.
+        default: present
+        type: str
+        choices:
+          - absent
+          - present
+  max_workers:
+    description:
+      - >-
+        The maximum number of rule collection groups read, and of firewall
+        policies written, at the same time when I(rule_collection_groups) is
+        specified.
+    type: int
+    default: 10
 extends_documentation_fragment:
   - azure
 author:
@@ -201,7 +274,58 @@ EXAMPLES = '''
                     - 10.0.0.0/24
                   web_categories:
                     - Hacking
-        
+
+    - name: Allow DNS and NTP, only the changed rules are reported
+      azure_rm_firewallpolicyrulecollectiongroup:
+        firewall_policy_name: firewallPolicy
+        resource_group_name: rg1
+        rule_collection_group_name: ruleCollectionGroup1
+        priority: 200
+        rule_collections:
+          - name: infrastructure
+            priority: 100
+            rule_collection_type: FirewallPolicyFilterRuleCollection
+            action:
+              type: Allow
+            rules:
+              - name: dns
+                rule_type: NetworkRule
+                ip_protocols:
+                  - UDP
+                source_addresses:
+                  - 10.0.0.0/16
+                destination_addresses:
+                  - 168.63.129.16
+                destination_ports:
+                  - '53'
+              - name: ntp
+                rule_type: NetworkRule
+                ip_protocols:
+                  - UDP
+                source_addresses:
+                  - 10.0.0.0/16
+                destination_addresses:
+                  - '*'
+                destination_ports:
+                  - '123'
+
+    - name: Apply the rule collection groups of several firewall policies
+      azure_rm_firewallpolicyrulecollectiongroup:
+        rule_collection_groups:
+          - resource_group_name: rg1
+            firewall_policy_name: policy-eu
+            rule_collection_group_name: platform
+            priority: 100
+            rule_collections: "{{ platform_rule_collections }}"
+          - resource_group_name: rg1
+            firewall_policy_name: policy-eu
+            rule_collection_group_name: applications
+            priority: 200
+            rule_collections: "{{ application_rule_collections }}"
+          - resource_group_name: rg2
+            firewall_policy_name: policy-us
+            rule_collection_group_name: legacy
+            state: absent
 
 '''
 
@@ -271,45 +395,195 @@ provisioning_state:
   returned: always
   type: str
   sample: null
+rule_collection_changes:
+  description:
+    - >-
+      The rule collections that differ from I(rule_collections), with the rules
+      that differ in each of them.
+  returned: when I(rule_collections) is specified
+  type: list
+  contains:
+    name:
+      description:
+        - The name of the rule collection.
+      returned: always
+      type: str
+      sample: infrastructure
+    action:
+      description:
+        - The change of the rule collection, C(create), C(update) or C(delete).
+      returned: always
+      type: str
+      sample: update
+    rules:
+      description:
+        - >-
+          The rules of the rule collection that are created, updated or deleted,
+          each with its C(name) and C(action).
+      returned: always
+      type: list
+      sample: [{"name": "ntp", "action": "create"}]
+rule_collection_groups:
+  description:
+    - The outcome for each entry of I(rule_collection_groups).
+  returned: when I(rule_collection_groups) is specified
+  type: list
+  contains:
+    resource_group_name:
+      description:
+        - The name of the resource group.
+      returned: always
+      type: str
+      sample: rg1
+    firewall_policy_name:
+      description:
+        - The name of the Firewall Policy.
+      returned: always
+      type: str
+      sample: policy-eu
+    rule_collection_group_name:
+      description:
+        - The name of the FirewallPolicyRuleCollectionGroup.
+      returned: always
+      type: str
+      sample: platform
+    action:
+      description:
+        - >-
+          The change of the rule collection group, C(create), C(update),
+          C(delete) or C(none).
+      returned: always
+      type: str
+      sample: update
+    rule_collection_changes:
+      description:
+        - The rule collections that differ, see C(rule_collection_changes).
+      returned: when the entry has I(rule_collections)
+      type: list
+    error:
+      description:
+        - >-
+          The error of the read or write, or the reason the write was skipped.
+      returned: when the entry could not be applied
+      type: str
 
 '''
 
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+from ansible.module_utils.six import string_types
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBaseExt
 try:
     from msrestazure.azure_exceptions import CloudError
     from azure.mgmt.network import NetworkManagementClient
     from msrestazure.azure_operation import AzureOperationPoller
     from msrest.polling import LROPoller
+    from msrest.exceptions import ClientRequestError
 except ImportError:
     # This is handled in azure_rm_common
     pass
 
 
+def comparable(value):
+    # Strings compare case-insensitively, as in default_compare.
+    return value.lower() if isinstance(value, string_types) else value
+
+
+def values_equal(desired, current):
+    '''
+    Compare a desired value with the current one. Only keys set in a desired
+    dict are compared, and lists are compared regardless of order.
+    '''
+    if isinstance(desired, dict):
+        return isinstance(current, dict) and all(values_equal(value, current.get(key))
+                                                 for key, value in desired.items() if value is not None)
+    if isinstance(desired, list):
+        if not isinstance(current, list) or len(desired) != len(current):
+            return False
+        if not any(isinstance(value, (dict, list)) for value in desired + current):
+            return (sorted((comparable(value) for value in desired), key=str) ==
+                    sorted((comparable(value) for value in current), key=str))
+        unmatched = list(current)
+        for value in desired:
+            match = next((index for index, item in enumerate(unmatched) if values_equal(value, item)), None)
+            if match is None:
+                return False
+            unmatched.pop(match)
+        return True
+    return comparable(desired) == comparable(current)
+
+
+def by_name(items):
+    return OrderedDict(((item.get('name') or '').lower(), item) for item in items or [])
+
+
+def diff_named(desired, current):
+    changes = []
+    current = by_name(current)
+    for key, item in by_name(desired).items():
+        if key not in current:
+            changes.append((item, 'create'))
+        elif not values_equal(item, current.pop(key)):
+            changes.append((item, 'update'))
+    changes.extend((item, 'delete') for item in current.values())
+    return changes
+
+
+def diff_rule_collections(desired, current):
+    '''
+    Diff rule collections by name, and the rules of each collection by name, so
+    that large collections are never compared element by element.
+    '''
+    changes = []
+    current = by_name(current)
+    for key, collection in by_name(desired).items():
+        existing = current.pop(key, None)
+        rules = diff_named(collection.get('rules') or [], existing.get('rules') if existing else [])
+        if existing is None:
+            action = 'create'
+        elif rules or not values_equal(dict((name, value) for name, value in collection.items() if name != 'rules'), existing):
+            action = 'update'
+        else:
+            continue
+        changes.append(dict(name=collection.get('name'),
+                            action=action,
+                            rules=[dict(name=rule.get('name'), action=rule_action) for rule, rule_action in rules]))
+    for existing in current.values():
+        changes.append(dict(name=existing.get('name'),
+                            action='delete',
+                            rules=[dict(name=rule.get('name'), action=rule_action)
+                                   for rule, rule_action in diff_named([], existing.get('rules'))]))
+    return changes
+
+
 class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
+ACTION_NAMES = {Actions.NoAction: 'none',
+                Actions.Create: 'create',
+                Actions.Update: 'update',
+                Actions.Delete: 'delete'}
+
+
 class AzureRMFirewallPolicyRuleCollectionGroup(AzureRMModuleBaseExt):
     def __init__(self):
         self.module_arg_spec = dict(
             resource_group_name=dict(
-                type='str',
-                required=True
+                type='str'
             ),
             firewall_policy_name=dict(
-                type='str',
-                required=True
+                type='str'
             ),
             rule_collection_group_name=dict(
-                type='str',
-                required=True
+                type='str'
             ),
             name=dict(
                 type='str',
                 disposition='/name'
             ),
             priority=dict(
-                type='integer',
+                type='int',
                 disposition='/priority'
             ),
             rule_collections=dict(
@@ -329,21 +603,63 @@ class AzureRMFirewallPolicyRuleCollectionGroup(AzureRMModuleBaseExt):
                         disposition='name'
                     ),
                     priority=dict(
-                        type='integer',
+                        type='int',
                         disposition='priority'
+                    ),
+                    action=dict(
+                        type='dict',
+                        disposition='action'
+                    ),
+                    rules=dict(
+                        type='list',
+                        disposition='rules',
+                        elements='dict'
                     )
                 )
             ),
+            state=dict(
+                type='str',
+                default='present',
+                choices=['present', 'absent']
+            ),
+            max_workers=dict(
+                type='int',
+                default=10
+            )
+        )
+
+        self.group_spec = dict(
+            resource_group_name=dict(
+                type='str',
+                required=True
+            ),
+            firewall_policy_name=dict(
+                type='str',
+                required=True
+            ),
+            rule_collection_group_name=dict(
+                type='str',
+                required=True
+            ),
             state=dict(
                 type='str',
                 default='present',
                 choices=['present', 'absent']
             )
         )
+        for key in ['priority', 'rule_collections']:
+            self.group_spec[key] = self.module_arg_spec[key]
+        self.module_arg_spec['rule_collection_groups'] = dict(
+            type='list',
+            elements='dict',
+            options=self.group_spec
+        )
 
         self.resource_group_name = None
         self.firewall_policy_name = None
         self.rule_collection_group_name = None
+        self.rule_collection_groups = None
+        self.max_workers = None
         self.body = {}
 
         self.results = dict(changed=False)
@@ -353,7 +669,12 @@ class AzureRMFirewallPolicyRuleCollectionGroup(AzureRMModuleBaseExt):
 
         super(AzureRMFirewallPolicyRuleCollectionGroup, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                                        supports_check_mode=True,
-                                                                       supports_tags=True)
+                                                                       supports_tags=True,
+                                                                       mutually_exclusive=[['rule_collection_group_name', 'rule_collection_groups']],
+                                                                       required_one_of=[['rule_collection_group_name', 'rule_collection_groups']],
+                                                                       required_together=[['resource_group_name',
+                                                                                           'firewall_policy_name',
+                                                                                           'rule_collection_group_name']])
 
     def exec_module(self, **kwargs):
         for key in list(self.module_arg_spec.keys()):
@@ -371,8 +692,16 @@ class AzureRMFirewallPolicyRuleCollectionGroup(AzureRMModuleBaseExt):
                                                     base_url=self._cloud_environment.endpoints.resource_manager,
                                                     api_version='2020-07-01')
 
+        if self.rule_collection_groups is not None:
+            self.apply_groups()
+            return self.results
+
         old_response = self.get_resource()
 
+        if self.state == 'present' and self.body.get('rule_collections') is not None:
+            current = old_response.get('rule_collections') if old_response else []
+            self.results['rule_collection_changes'] = diff_rule_collections(self.body['rule_collections'], current)
+
         if not old_response:
             if self.state == 'present':
                 self.to_do = Actions.Create
@@ -380,11 +709,14 @@ class AzureRMFirewallPolicyRuleCollectionGroup(AzureRMModuleBaseExt):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             else:
+                # Rule collections are diffed by name above, the generic compare would also flag a new order.
+                body = dict((key, value) for key, value in self.body.items() if key != 'rule_collections')
                 modifiers = {}
                 self.create_compare_modifiers(self.module_arg_spec, '', modifiers)
                 self.results['modifiers'] = modifiers
                 self.results['compare'] = []
-                if not self.default_compare(modifiers, self.body, old_response, '', self.results):
+                if (not self.default_compare(modifiers, body, old_response, '', self.results) or
+                        self.results.get('rule_collection_changes')):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -403,6 +735,114 @@ class AzureRMFirewallPolicyRuleCollectionGroup(AzureRMModuleBaseExt):
 
         return self.results
 
+    def apply_groups(self):
+        entries = []
+        for group in self.rule_collection_groups:
+            body = {}
+            for key in ['priority', 'rule_collections']:
+                if group.get(key) is not None:
+                    body[key] = group[key]
+            self.inflate_parameters(self.group_spec, body, 0)
+            entries.append(dict(group=group, body=body))
+
+        # Reads of all groups, also of the same policy, can run side by side.
+        pool = ThreadPool(max(1, min(self.max_workers, len(entries))))
+        try:
+            responses = pool.map(self.read_group, [entry['group'] for entry in entries])
+        finally:
+            pool.close()
+            pool.join()
+
+        modifiers = {}
+        self.create_compare_modifiers(self.group_spec, '', modifiers)
+        self.results['compare'] = []
+        policies = OrderedDict()
+        for entry, (old_response, error) in zip(entries, responses):
+            group = entry['group']
+            entry['result'] = dict(resource_group_name=group['resource_group_name'],
+                                   firewall_policy_name=group['firewall_policy_name'],
+                                   rule_collection_group_name=group['rule_collection_group_name'])
+            if error is not None:
+                entry['result'].update(action=ACTION_NAMES[Actions.NoAction], error=error)
+                continue
+            to_do = Actions.NoAction
+            if group['state'] == 'absent':
+                if old_response:
+                    to_do = Actions.Delete
+            else:
+                if entry['body'].get('rule_collections') is not None:
+                    current = old_response.get('rule_collections') if old_response else []
+                    entry['result']['rule_collection_changes'] = diff_rule_collections(entry['body']['rule_collections'], current)
+                if not old_response:
+                    to_do = Actions.Create
+                else:
+                    body = dict((key, value) for key, value in entry['body'].items() if key != 'rule_collections')
+                    if (not self.default_compare(modifiers, body, old_response, '', self.results) or
+                            entry['result'].get('rule_collection_changes')):
+                        to_do = Actions.Update
+            entry['to_do'] = to_do
+            entry['result']['action'] = ACTION_NAMES[to_do]
+            if to_do != Actions.NoAction:
+                policy = (group['resource_group_name'].lower(), group['firewall_policy_name'].lower())
+                policies.setdefault(policy, []).append(entry)
+
+        self.results['changed'] = len(policies) > 0
+        self.results['rule_collection_groups'] = [entry['result'] for entry in entries]
+        if not self.check_mode and policies:
+            # Writes to one policy are serialized by Azure, so each policy gets one worker that writes in turn.
+            pool = ThreadPool(max(1, min(self.max_workers, len(policies))))
+            try:
+                pool.map(self.write_policy_groups, policies.values())
+            finally:
+                pool.close()
+                pool.join()
+
+        errors = [entry['result'] for entry in entries if 'error' in entry['result']]
+        if errors:
+            self.fail('Error applying {0} of {1} rule collection groups: {2}'.format(
+                len(errors), len(entries), '; '.join('{0}/{1}: {2}'.format(result['firewall_policy_name'],
+                                                                         result['rule_collection_group_name'],
+                                                                         result['error'])
+                                                    for result in errors)), **self.results)
+
+    def read_group(self, group):
+        try:
+            response = self.mgmt_client.firewall_policy_rule_collection_groups.get(resource_group_name=group['resource_group_name'],
+                                                                                   firewall_policy_name=group['firewall_policy_name'],
+                                                                                   rule_collection_group_name=group['rule_collection_group_name'])
+        except CloudError as e:
+            if e.status_code == 404:
+                return False, None
+            return None, str(e)
+        except ClientRequestError as e:
+            return None, str(e)
+        return response.as_dict(), None
+
+    def write_policy_groups(self, entries):
+        # Deletes go first so that their priorities are free for the groups written after them.
+        entries = sorted(entries, key=lambda entry: (entry['to_do'] != Actions.Delete,
+                                                     entry['body'].get('priority') or 0))
+        for index, entry in enumerate(entries):
+            group = entry['group']
+            try:
+                if entry['to_do'] == Actions.Delete:
+                    response = self.mgmt_client.firewall_policy_rule_collection_groups.delete(resource_group_name=group['resource_group_name'],
+                                                                                              firewall_policy_name=group['firewall_policy_name'],
+                                                                                              rule_collection_group_name=group['rule_collection_group_name'])
+                else:
+                    response = self.mgmt_client.firewall_policy_rule_collection_groups.create_or_update(resource_group_name=group['resource_group_name'],
+                                                                                                        firewall_policy_name=group['firewall_policy_name'],
+                                                                                                        rule_collection_group_name=group['rule_collection_group_name'],
+                                                                                                        parameters=entry['body'])
+                if isinstance(response, AzureOperationPoller) or isinstance(response, LROPoller):
+                    response = self.get_poller_result(response)
+            except Exception as exc:
+                # Other policies may already be written, so any error is reported with its entry instead of escaping.
+                entry['result']['error'] = str(exc)
+                for skipped in entries[index + 1:]:
+                    skipped['result']['error'] = 'Skipped after the error writing {0}.'.format(group['rule_collection_group_name'])
+                return
+
     def create_update_resource(self):
         try:
             response = self.mgmt_client.firewall_policy_rule_collection_groups.create_or_update(resource_group_name=self.resource_group_name,
@@ -433,7 +873,10 @@ class AzureRMFirewallPolicyRuleCollectionGroup(AzureRMModuleBaseExt):
                                                                                    firewall_policy_name=self.firewall_policy_name,
                                                                                    rule_collection_group_name=self.rule_collection_group_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the FirewallPolicyRuleCollectionGroup instance.')
+            self.fail('Error getting the FirewallPolicyRuleCollectionGroup instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -400,7 +400,10 @@ class AzureRMIpAllocation(AzureRMModuleBaseExt):
                                                            ip_allocation_name=self.ip_allocation_name,
                                                            expand=self.expand)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the IpAllocation instance.')
+            self.fail('Error getting the IpAllocation instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -40,7 +40,46 @@ options:
   ip_addresses:
     description:
       - IpAddresses/IpAddressPrefixes in the IpGroups resource.
+      - >-
+        Entries are addresses, prefixes or address ranges such as
+        C(10.0.0.1-10.0.0.9). They are normalized and compared as a set, so
+        neither order nor notation, for example C(10.0.0.1/32) and C(10.0.0.1),
+        is a change.
     type: list
+    elements: str
+  ip_addresses_mode:
+    description:
+      - C(replace) makes I(ip_addresses) the complete list of the IpGroup.
+      - C(append) adds I(ip_addresses) to the current list.
+      - C(remove) removes I(ip_addresses) from the current list.
+    type: str
+    choices:
+      - replace
+      - append
+      - remove
+    default: replace
+  aggregate:
+    description:
+      - >-
+        Collapse adjacent and overlapping prefixes and address ranges of the
+        resulting list into the fewest prefixes covering the same addresses.
+      - >-
+        With I(ip_addresses_mode=remove), the addresses are then also removed from
+        larger prefixes that contain them.
+    type: bool
+    default: false
+  fingerprint_cache:
+    description:
+      - >-
+        Path of a local JSON file holding a hash of the last applied
+        configuration of each IpGroup managed by this module.
+      - >-
+        When the hash of the desired configuration matches, the run reports no
+        change without reading the IpGroup. Changes made outside this module
+        are therefore not detected until the desired configuration changes or
+        the file is removed.
+      - Only used with I(ip_addresses_mode=replace).
+    type: path
   firewalls:
     description:
       - >-
@@ -95,6 +134,22 @@ EXAMPLES = '''
           key1: value1
         
 
+    - name: Add the new entries of a threat feed
+      azure_rm_ipgroup:
+        ip_groups_name: threat-feed
+        resource_group_name: myResourceGroup
+        ip_addresses: "{{ new_feed_entries }}"
+        ip_addresses_mode: append
+        aggregate: true
+
+    - name: Apply the complete threat feed, skipping the read when it did not change
+      azure_rm_ipgroup:
+        ip_groups_name: threat-feed
+        resource_group_name: myResourceGroup
+        ip_addresses: "{{ feed_entries }}"
+        aggregate: true
+        fingerprint_cache: /var/cache/ansible/ipgroups.json
+
     - name: Delete_IpGroups
       azure_rm_ipgroup: 
         ip_groups_name: ipGroups1
@@ -182,9 +237,27 @@ firewall_policies:
       returned: always
       type: str
       sample: null
+ip_addresses_diff:
+  description:
+    - The entries added to and removed from the IpGroup.
+  returned: when I(ip_addresses) is specified and the IpGroup is read
+  type: dict
+  sample: {"added": ["192.0.2.0/24"], "removed": ["198.51.100.7"]}
+fingerprint:
+  description:
+    - The hash of the desired configuration, as kept in I(fingerprint_cache).
+  returned: when I(fingerprint_cache) is used
+  type: str
+  sample: 3b5d5c3712955042212316173ccf37be800de0e2c8d8c2a1d3e3a3c4e3b2b7a1
 
 '''
 
+import hashlib
+import json
+import os
+import tempfile
+from ansible.module_utils._text import to_text
+from ansible.module_utils.compat import ipaddress
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBaseExt
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -200,6 +273,94 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
+def parse_ip_range(entry):
+    first, last = [ipaddress.ip_address(part.strip()) for part in entry.split('-', 1)]
+    if first.version != last.version:
+        raise ValueError('{0} mixes IPv{1} and IPv{2} addresses'.format(entry, first.version, last.version))
+    if first > last:
+        raise ValueError('{0} ends before it starts'.format(entry))
+    return first, last
+
+
+def parse_ip_entry(entry):
+    '''
+    Return the networks covered by an IpGroup entry: an address, a prefix or
+    an address range.
+    '''
+    entry = to_text(entry).strip()
+    if '-' in entry:
+        return list(ipaddress.summarize_address_range(*parse_ip_range(entry)))
+    return [ipaddress.ip_network(entry, strict=False)]
+
+
+def format_network(network):
+    if network.prefixlen == network.max_prefixlen:
+        return str(network.network_address)
+    return str(network)
+
+
+def canonical_ip_entry(entry):
+    entry = to_text(entry).strip()
+    if '-' in entry:
+        return '-'.join(str(address) for address in parse_ip_range(entry))
+    return format_network(ipaddress.ip_network(entry, strict=False))
+
+
+def ip_entry_sort_key(entry):
+    try:
+        network = parse_ip_entry(entry)[0]
+    except ValueError:
+        # Entries of the service that cannot be parsed are kept as they are, after all others.
+        return (7, 0, 0, entry)
+    return (network.version, int(network.network_address), network.prefixlen, entry)
+
+
+def collapse_networks(networks):
+    collapsed = []
+    for version in (4, 6):
+        collapsed.extend(ipaddress.collapse_addresses([network for network in networks if network.version == version]))
+    return collapsed
+
+
+def exclude_networks(networks, removed):
+    result = []
+    pending = list(networks)
+    while pending:
+        network = pending.pop()
+        overlap = next((item for item in removed if item.version == network.version and item.overlaps(network)), None)
+        if overlap is None:
+            result.append(network)
+        elif not (overlap.network_address <= network.network_address and
+                  overlap.broadcast_address >= network.broadcast_address):
+            # Prefixes either nest or are disjoint, so the removed one lies inside this network.
+            pending.extend(network.address_exclude(overlap))
+    return result
+
+
+def merge_ip_addresses(current, desired, mode, aggregate):
+    '''
+    Return the sorted list of IpGroup entries resulting from applying the
+    desired entries to the current ones.
+    '''
+    if mode == 'replace':
+        current = []
+    if aggregate:
+        networks = [network for entry in current for network in parse_ip_entry(entry)]
+        desired_networks = [network for entry in desired for network in parse_ip_entry(entry)]
+        if mode == 'remove':
+            networks = exclude_networks(collapse_networks(networks), desired_networks)
+        else:
+            networks.extend(desired_networks)
+        entries = set(format_network(network) for network in collapse_networks(networks))
+    else:
+        entries = set(canonical_ip_entry(entry) for entry in current)
+        if mode == 'remove':
+            entries.difference_update(canonical_ip_entry(entry) for entry in desired)
+        else:
+            entries.update(canonical_ip_entry(entry) for entry in desired)
+    return sorted(entries, key=ip_entry_sort_key)
+
+
 class AzureRMIpGroup(AzureRMModuleBaseExt):
     def __init__(self):
         self.module_arg_spec = dict(
@@ -219,6 +380,18 @@ class AzureRMIpGroup(AzureRMModuleBaseExt):
                 disposition='/ip_addresses',
                 elements='str'
             ),
+            ip_addresses_mode=dict(
+                type='str',
+                choices=['replace', 'append', 'remove'],
+                default='replace'
+            ),
+            aggregate=dict(
+                type='bool',
+                default=False
+            ),
+            fingerprint_cache=dict(
+                type='path'
+            ),
             firewalls=dict(
                 type='list',
                 updatable=False,
@@ -253,6 +426,9 @@ class AzureRMIpGroup(AzureRMModuleBaseExt):
         self.resource_group_name = None
         self.ip_groups_name = None
         self.expand = None
+        self.ip_addresses_mode = None
+        self.aggregate = None
+        self.fingerprint_cache = None
         self.body = {}
 
         self.results = dict(changed=False)
@@ -280,8 +456,26 @@ class AzureRMIpGroup(AzureRMModuleBaseExt):
                                                     base_url=self._cloud_environment.endpoints.resource_manager,
                                                     api_version='2020-07-01')
 
+        desired_ip_addresses = self.body.pop('ip_addresses', None)
+        fingerprint = None
+        if self.state == 'present' and self.fingerprint_cache and self.ip_addresses_mode == 'replace':
+            self.body['ip_addresses'] = self.merge_ip_addresses([], desired_ip_addresses or [])
+            fingerprint = self.body_fingerprint()
+            self.results['fingerprint'] = fingerprint
+            if self.read_cached_fingerprint() == fingerprint:
+                return self.results
+            self.body.pop('ip_addresses')
+
         old_response = self.get_resource()
 
+        if desired_ip_addresses is not None:
+            current = (old_response or {}).get('ip_addresses') or []
+            self.body['ip_addresses'] = self.merge_ip_addresses(current, desired_ip_addresses)
+            current = set(self.canonical_entries(current))
+            self.results['ip_addresses_diff'] = dict(added=[entry for entry in self.body['ip_addresses'] if entry not in current],
+                                                     removed=sorted(current.difference(self.body['ip_addresses']),
+                                                                    key=ip_entry_sort_key))
+
         if not old_response:
             if self.state == 'present':
                 self.to_do = Actions.Create
@@ -289,11 +483,15 @@ class AzureRMIpGroup(AzureRMModuleBaseExt):
             if self.state == 'absent':
                 self.to_do = Actions.Delete
             else:
+                # ip_addresses is compared as a set above, the generic compare would also flag a new order.
+                body = dict((key, value) for key, value in self.body.items() if key != 'ip_addresses')
                 modifiers = {}
                 self.create_compare_modifiers(self.module_arg_spec, '', modifiers)
                 self.results['modifiers'] = modifiers
                 self.results['compare'] = []
-                if not self.default_compare(modifiers, self.body, old_response, '', self.results):
+                ip_addresses_diff = self.results.get('ip_addresses_diff', {})
+                if (not self.default_compare(modifiers, body, old_response, '', self.results) or
+                        ip_addresses_diff.get('added') or ip_addresses_diff.get('removed')):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -301,17 +499,73 @@ class AzureRMIpGroup(AzureRMModuleBaseExt):
             if self.check_mode:
                 return self.results
             response = self.create_update_resource()
+            self.write_cached_fingerprint(fingerprint)
         elif self.to_do == Actions.Delete:
             self.results['changed'] = True
             if self.check_mode:
                 return self.results
             self.delete_resource()
+            self.write_cached_fingerprint(None)
         else:
             self.results['changed'] = False
             response = old_response
+            self.write_cached_fingerprint(fingerprint)
 
         return self.results
 
+    def merge_ip_addresses(self, current, desired):
+        try:
+            return merge_ip_addresses(current, desired, self.ip_addresses_mode, self.aggregate)
+        except ValueError as exc:
+            self.fail('Invalid entry in ip_addresses: {0}'.format(str(exc)))
+
+    def canonical_entries(self, entries):
+        # Entries stored by the service are kept as they are if they cannot be parsed.
+        result = []
+        for entry in entries:
+            try:
+                result.append(canonical_ip_entry(entry))
+            except ValueError:
+                result.append(entry)
+        return result
+
+    def body_fingerprint(self):
+        return hashlib.sha256(json.dumps(self.body, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def fingerprint_cache_key(self):
+        return '/'.join([self.subscription_id,
+                         self.resource_group_name,
+                         self.ip_groups_name]).lower()
+
+    def load_fingerprint_cache(self):
+        try:
+            with open(self.fingerprint_cache) as cache_file:
+                return json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def read_cached_fingerprint(self):
+        return self.load_fingerprint_cache().get(self.fingerprint_cache_key())
+
+    def write_cached_fingerprint(self, fingerprint):
+        if not self.fingerprint_cache:
+            return
+        cache = self.load_fingerprint_cache()
+        if fingerprint is None:
+            if cache.pop(self.fingerprint_cache_key(), None) is None:
+                return
+        else:
+            cache[self.fingerprint_cache_key()] = fingerprint
+        # Write to a temporary file first so concurrent forks never read a partial cache.
+        cache_dir = os.path.dirname(os.path.abspath(self.fingerprint_cache))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(cache, cache_file)
+            os.rename(tmp_path, self.fingerprint_cache)
+        except (IOError, OSError) as exc:
+            self.log('Could not write the fingerprint cache: {0}'.format(str(exc)))
+
     def create_update_resource(self):
         try:
             response = self.mgmt_client.ip_groups.create_or_update(resource_group_name=self.resource_group_name,
@@ -340,7 +594,10 @@ class AzureRMIpGroup(AzureRMModuleBaseExt):
                                                       ip_groups_name=self.ip_groups_name,
                                                       expand=self.expand)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the IpGroup instance.')
+            self.fail('Error getting the IpGroup instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
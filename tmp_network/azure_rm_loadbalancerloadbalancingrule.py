@@ -326,7 +326,10 @@ class AzureRMLoadBalancerLoadBalancingRule(AzureRMModuleBaseExt):
                                                                                load_balancer_name=self.load_balancer_name,
                                                                                load_balancing_rule_name=self.load_balancing_rule_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the LoadBalancerLoadBalancingRule instance.')
+            self.fail('Error getting the LoadBalancerLoadBalancingRule instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -157,7 +157,10 @@ class AzureRMLoadBalancerNetworkInterface(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.load_balancer_network_interfaces.get()
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the LoadBalancerNetworkInterface instance.')
+            self.fail('Error getting the LoadBalancerNetworkInterface instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
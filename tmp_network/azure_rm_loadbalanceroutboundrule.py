@@ -274,7 +274,10 @@ class AzureRMLoadBalancerOutboundRule(AzureRMModuleBaseExt):
                                                                          load_balancer_name=self.load_balancer_name,
                                                                          outbound_rule_name=self.outbound_rule_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the LoadBalancerOutboundRule instance.')
+            self.fail('Error getting the LoadBalancerOutboundRule instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
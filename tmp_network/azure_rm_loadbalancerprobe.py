@@ -280,7 +280,10 @@ class AzureRMLoadBalancerProbe(AzureRMModuleBaseExt):
                                                                  load_balancer_name=self.load_balancer_name,
                                                                  probe_name=self.probe_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the LoadBalancerProbe instance.')
+            self.fail('Error getting the LoadBalancerProbe instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
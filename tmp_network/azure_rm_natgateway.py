@@ -425,7 +425,10 @@ class AzureRMNatGateway(AzureRMModuleBaseExt):
                                                          nat_gateway_name=self.nat_gateway_name,
                                                          expand=self.expand)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the NatGateway instance.')
+            self.fail('Error getting the NatGateway instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
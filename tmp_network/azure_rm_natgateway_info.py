@@ -33,6 +33,32 @@ options:
     description:
       - Expands referenced resources.
     type: str
+  resource_groups:
+    description:
+      - >-
+        List the nat gateways of several resource groups concurrently instead of a
+        single I(resource_group_name).
+      - >-
+        Combined with I(subscriptions), every resource group is listed in every
+        subscription.
+    type: list
+    elements: str
+  subscriptions:
+    description:
+      - >-
+        IDs of the subscriptions to list the nat gateways of. Every subscription is
+        listed concurrently and gets one client, shared by its resource groups.
+      - Defaults to the subscription of the module credentials.
+      - The credentials must have read access to every subscription.
+    type: list
+    elements: str
+  max_workers:
+    description:
+      - >-
+        The maximum number of resource groups or subscriptions listed at the same
+        time when I(resource_groups) or I(subscriptions) is specified.
+    type: int
+    default: 10
 extends_documentation_fragment:
   - azure
 author:
@@ -53,7 +79,15 @@ EXAMPLES = '''
     - name: List nat gateways in resource group
       azure_rm_natgateway_info: 
         resource_group_name: rg1
-        
+
+    - name: List nat gateways in several resource groups of several subscriptions
+      azure_rm_natgateway_info:
+        subscriptions:
+          - 00000000-0000-0000-0000-000000000000
+          - 11111111-1111-1111-1111-111111111111
+        resource_groups:
+          - rg1
+          - rg2
 
 '''
 
@@ -270,15 +304,43 @@ nat_gateways:
       returned: always
       type: str
       sample: null
+errors:
+  description:
+    - >-
+      The resource groups or subscriptions that could not be listed when
+      I(resource_groups) or I(subscriptions) is specified. The nat gateways of all other
+      scopes are still returned.
+  returned: when I(resource_groups) or I(subscriptions) is specified
+  type: list
+  contains:
+    subscription_id:
+      description:
+        - The ID of the subscription.
+      returned: always
+      type: str
+      sample: 00000000-0000-0000-0000-000000000000
+    resource_group_name:
+      description:
+        - The name of the resource group, null for a subscription wide listing.
+      returned: always
+      type: str
+      sample: rg1
+    error:
+      description:
+        - The error returned for this scope.
+      returned: always
+      type: str
 
 '''
 
+from multiprocessing.pool import ThreadPool
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBase
 try:
     from msrestazure.azure_exceptions import CloudError
     from azure.mgmt.network import NetworkManagementClient
     from msrestazure.azure_operation import AzureOperationPoller
     from msrest.polling import LROPoller
+    from msrest.exceptions import ClientRequestError
 except ImportError:
     # This is handled in azure_rm_common
     pass
@@ -295,12 +357,27 @@ class AzureRMNatGatewayInfo(AzureRMModuleBase):
             ),
             expand=dict(
                 type='str'
+            ),
+            resource_groups=dict(
+                type='list',
+                elements='str'
+            ),
+            subscriptions=dict(
+                type='list',
+                elements='str'
+            ),
+            max_workers=dict(
+                type='int',
+                default=10
             )
         )
 
         self.resource_group_name = None
         self.nat_gateway_name = None
         self.expand = None
+        self.resource_groups = None
+        self.subscriptions = None
+        self.max_workers = None
 
         self.results = dict(changed=False)
         self.mgmt_client = None
@@ -314,7 +391,12 @@ class AzureRMNatGatewayInfo(AzureRMModuleBase):
         self.header_parameters['Content-Type'] = 'application/json; charset=utf-8'
 
         self.mgmt_client = None
-        super(AzureRMNatGatewayInfo, self).__init__(self.module_arg_spec, supports_tags=True)
+        mutually_exclusive = [['resource_group_name', 'resource_groups'],
+                              ['nat_gateway_name', 'resource_groups'],
+                              ['nat_gateway_name', 'subscriptions']]
+        super(AzureRMNatGatewayInfo, self).__init__(self.module_arg_spec,
+                                                    mutually_exclusive=mutually_exclusive,
+                                                    supports_tags=True)
 
     def exec_module(self, **kwargs):
 
@@ -325,8 +407,10 @@ class AzureRMNatGatewayInfo(AzureRMModuleBase):
                                                     base_url=self._cloud_environment.endpoints.resource_manager,
                                                     api_version='2020-07-01')
 
-        if (self.resource_group_name is not None and
-            self.nat_gateway_name is not None):
+        if self.resource_groups is not None or self.subscriptions is not None:
+            self.results['nat_gateways'], self.results['errors'] = self.list_scopes()
+        elif (self.resource_group_name is not None and
+              self.nat_gateway_name is not None):
             self.results['nat_gateways'] = self.format_item(self.get())
         elif (self.resource_group_name is not None):
             self.results['nat_gateways'] = self.format_item(self.list())
@@ -366,6 +450,51 @@ class AzureRMNatGatewayInfo(AzureRMModuleBase):
 
         return response
 
+    def list_scopes(self):
+        clients = {}
+        for subscription_id in self.subscriptions or [self.subscription_id]:
+            clients[subscription_id] = self.get_subscription_client(subscription_id)
+        resource_groups = self.resource_groups or ([self.resource_group_name] if self.resource_group_name else [None])
+        scopes = [(subscription_id, resource_group_name)
+                  for subscription_id in clients
+                  for resource_group_name in resource_groups]
+
+        pool = ThreadPool(max(1, min(self.max_workers, len(scopes))))
+        try:
+            responses = pool.map(lambda scope: self.list_scope(clients[scope[0]], scope[1]), scopes)
+        finally:
+            pool.close()
+            pool.join()
+
+        items = []
+        errors = []
+        for (subscription_id, resource_group_name), (response, error) in zip(scopes, responses):
+            if error is not None:
+                errors.append(dict(subscription_id=subscription_id,
+                                   resource_group_name=resource_group_name,
+                                   error=error))
+            else:
+                items.extend(response)
+        return items, errors
+
+    def get_subscription_client(self, subscription_id):
+        if subscription_id == self.subscription_id:
+            return self.mgmt_client
+        client = self.get_mgmt_svc_client(NetworkManagementClient,
+                                          base_url=self._cloud_environment.endpoints.resource_manager,
+                                          api_version='2020-07-01')
+        client.config.subscription_id = subscription_id
+        return client
+
+    def list_scope(self, client, resource_group_name):
+        # Pages are fetched here so that the requests run on the worker thread.
+        try:
+            if resource_group_name is not None:
+                return self.format_item(client.nat_gateways.list(resource_group_name=resource_group_name)), None
+            return self.format_item(client.nat_gateways.list_all()), None
+        except (CloudError, ClientRequestError) as e:
+            return None, str(e)
+
     def format_item(self, item):
         if hasattr(item, 'as_dict'):
             return [item.as_dict()]
@@ -157,7 +157,10 @@ class AzureRMNetworkInterfaceLoadBalancer(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.network_interface_load_balancers.get()
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the NetworkInterfaceLoadBalancer instance.')
+            self.fail('Error getting the NetworkInterfaceLoadBalancer instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
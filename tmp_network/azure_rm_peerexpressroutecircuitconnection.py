@@ -290,7 +290,10 @@ class AzureRMPeerExpressRouteCircuitConnection(AzureRMModuleBaseExt):
                                                                                    peering_name=self.peering_name,
                                                                                    connection_name=self.connection_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the PeerExpressRouteCircuitConnection instance.')
+            self.fail('Error getting the PeerExpressRouteCircuitConnection instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -144,6 +144,13 @@ provisioning_state:
 
 '''
 
+import errno
+import fcntl
+import os
+import random
+import stat
+import tempfile
+import time
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBaseExt
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -159,6 +166,76 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
+MAX_THROTTLE_RETRIES = 6
+MAX_THROTTLE_DELAY = 300
+# Below this many requests left in the subscription budget every process slows down,
+# up to LOW_BUDGET_DELAY seconds when the budget is spent.
+LOW_BUDGET_REQUESTS = 100
+LOW_BUDGET_DELAY = 30
+RATE_LIMIT_HEADERS = ('x-ms-ratelimit-remaining-subscription-reads',
+                      'x-ms-ratelimit-remaining-subscription-writes',
+                      'x-ms-ratelimit-remaining-subscription-deletes')
+
+
+def throttle_state_path(subscription_id):
+    # The directory must belong to the current user and be private to it, otherwise
+    # another local user could plant the state file; throttling then stays per process.
+    directory = os.path.join(tempfile.gettempdir(), 'ansible-azure-{0}'.format(os.getuid()))
+    try:
+        os.mkdir(directory, 0o700)
+    except OSError as exc:
+        if exc.errno != errno.EEXIST:
+            return None
+    try:
+        info = os.lstat(directory)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        return None
+    return os.path.join(directory, 'throttle-{0}'.format(subscription_id))
+
+
+def read_throttle_deadline(path):
+    if path is None:
+        return 0
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW)
+        with os.fdopen(fd) as state_file:
+            return float(state_file.read() or 0)
+    except (IOError, OSError, ValueError):
+        return 0
+
+
+def remaining_requests(headers):
+    remaining = []
+    for header in RATE_LIMIT_HEADERS:
+        try:
+            remaining.append(int(headers.get(header)))
+        except (TypeError, ValueError):
+            pass
+    return min(remaining) if remaining else None
+
+
+def extend_throttle_deadline(path, deadline):
+    # Concurrent module processes share the file, keep the latest deadline any of them was given.
+    if path is None:
+        return
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        with os.fdopen(fd, 'r+') as state_file:
+            fcntl.flock(state_file, fcntl.LOCK_EX)
+            try:
+                current = float(state_file.read() or 0)
+            except ValueError:
+                current = 0
+            if deadline > current:
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(str(deadline))
+    except (IOError, OSError):
+        pass
+
+
 class AzureRMRoute(AzureRMModuleBaseExt):
     def __init__(self):
         self.module_arg_spec = dict(
@@ -211,6 +288,8 @@ class AzureRMRoute(AzureRMModuleBaseExt):
         self.mgmt_client = None
         self.state = None
         self.to_do = Actions.NoAction
+        self.throttle_path = None
+        self.throttle_deadline = 0
 
         super(AzureRMRoute, self).__init__(derived_arg_spec=self.module_arg_spec,
                                            supports_check_mode=True,
@@ -231,6 +310,8 @@ class AzureRMRoute(AzureRMModuleBaseExt):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager,
                                                     api_version='2020-07-01')
+        self.throttle_path = throttle_state_path(self.subscription_id)
+        self.mgmt_client.config.hooks.append(self.track_rate_limit)
 
         old_response = self.get_resource()
 
@@ -266,10 +347,11 @@ class AzureRMRoute(AzureRMModuleBaseExt):
 
     def create_update_resource(self):
         try:
-            response = self.mgmt_client.routes.create_or_update(resource_group_name=self.resource_group_name,
-                                                                route_table_name=self.route_table_name,
-                                                                route_name=self.route_name,
-                                                                route_parameters=self.body)
+            response = self.send_request(self.mgmt_client.routes.create_or_update,
+                                         resource_group_name=self.resource_group_name,
+                                         route_table_name=self.route_table_name,
+                                         route_name=self.route_name,
+                                         route_parameters=self.body)
             if isinstance(response, AzureOperationPoller) or isinstance(response, LROPoller):
                 response = self.get_poller_result(response)
         except CloudError as exc:
@@ -279,22 +361,65 @@ class AzureRMRoute(AzureRMModuleBaseExt):
 
     def delete_resource(self):
         try:
-            response = self.mgmt_client.routes.delete(resource_group_name=self.resource_group_name,
-                                                      route_table_name=self.route_table_name,
-                                                      route_name=self.route_name)
+            response = self.send_request(self.mgmt_client.routes.delete,
+                                         resource_group_name=self.resource_group_name,
+                                         route_table_name=self.route_table_name,
+                                         route_name=self.route_name)
         except CloudError as e:
             self.log('Error attempting to delete the Route instance.')
             self.fail('Error deleting the Route instance: {0}'.format(str(e)))
 
         return True
 
+    def send_request(self, operation, **kwargs):
+        for attempt in range(MAX_THROTTLE_RETRIES + 1):
+            deadline = max(read_throttle_deadline(self.throttle_path), self.throttle_deadline)
+            delay = min(deadline - time.time(), MAX_THROTTLE_DELAY)
+            if delay > 0:
+                self.log('Requests to the subscription are throttled, waiting {0:.0f} seconds.'.format(delay))
+                time.sleep(delay)
+            try:
+                return operation(**kwargs)
+            except CloudError as exc:
+                if exc.status_code != 429 or attempt == MAX_THROTTLE_RETRIES:
+                    raise
+                delay = self.retry_after(exc)
+                if delay is None:
+                    delay = min(2 ** attempt, 60) * (1 + random.random())
+                self.throttle(delay)
+
+    def throttle(self, delay):
+        # The local deadline still applies when the shared state file cannot be used.
+        deadline = time.time() + min(max(delay, 0), MAX_THROTTLE_DELAY)
+        self.throttle_deadline = max(self.throttle_deadline, deadline)
+        extend_throttle_deadline(self.throttle_path, deadline)
+
+    def track_rate_limit(self, response, *args, **kwargs):
+        # Response hook of the client, it also sees the requests made by pollers.
+        remaining = remaining_requests(response.headers)
+        if remaining is not None and remaining < LOW_BUDGET_REQUESTS:
+            self.throttle(LOW_BUDGET_DELAY * (LOW_BUDGET_REQUESTS - max(remaining, 0)) / float(LOW_BUDGET_REQUESTS))
+        return response
+
+    def retry_after(self, exc):
+        if exc.response is None:
+            return None
+        try:
+            return int(exc.response.headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
+
     def get_resource(self):
         try:
-            response = self.mgmt_client.routes.get(resource_group_name=self.resource_group_name,
-                                                   route_table_name=self.route_table_name,
-                                                   route_name=self.route_name)
+            response = self.send_request(self.mgmt_client.routes.get,
+                                         resource_group_name=self.resource_group_name,
+                                         route_table_name=self.route_table_name,
+                                         route_name=self.route_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the Route instance.')
+            self.fail('Error getting the Route instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -34,7 +34,7 @@ options:
   security_rule_name:
     description:
       - The name of the security rule.
-    required: true
+      - Required unless I(rules) is specified.
     type: str
   name:
     description:
@@ -113,7 +113,7 @@ options:
         The priority of the rule. The value can be between 100 and 4096. The
         priority number must be unique for each rule in the collection. The
         lower the priority number, the higher the priority of the rule.
-    type: integer
+    type: int
   direction:
     description:
       - >-
@@ -133,6 +133,119 @@ options:
     choices:
       - absent
       - present
+  rules:
+    description:
+      - >-
+        List of security rules to reconcile against the network security group in
+        a single run, instead of one I(security_rule_name).
+      - >-
+        The network security group is read once, and all created, updated and
+        deleted rules are applied in one update of the network security group.
+      - Mutually exclusive with I(security_rule_name).
+    type: list
+    elements: dict
+    suboptions:
+      security_rule_name:
+        description:
+          - The name of the security rule.
+        required: true
+        type: str
+      state:
+        description:
+          - Assert the state of this security rule.
+        default: present
+        type: str
+        choices:
+          - absent
+          - present
+      description:
+        description:
+          - A description for this rule. Restricted to 140 chars.
+        type: str
+      protocol:
+        description:
+          - Network protocol this rule applies to.
+        type: str
+        choices:
+          - Tcp
+          - Udp
+          - Icmp
+          - Esp
+          - '*'
+          - Ah
+      source_port_range:
+        description:
+          - >-
+            The source port or range. Integer or range between 0 and 65535. Asterisk
+            '*' can also be used to match all ports.
+        type: str
+      destination_port_range:
+        description:
+          - >-
+            The destination port or range. Integer or range between 0 and 65535.
+            Asterisk '*' can also be used to match all ports.
+        type: str
+      source_address_prefix:
+        description:
+          - >-
+            The CIDR or source IP range. Asterisk '*' can also be used to match all
+            source IPs. Default tags such as 'VirtualNetwork', 'AzureLoadBalancer'
+            and 'Internet' can also be used. If this is an ingress rule, specifies
+            where network traffic originates from.
+        type: str
+      source_address_prefixes:
+        description:
+          - The CIDR or source IP ranges.
+        type: list
+      destination_address_prefix:
+        description:
+          - >-
+            The destination address prefix. CIDR or destination IP range. Asterisk
+            '*' can also be used to match all source IPs. Default tags such as
+            'VirtualNetwork', 'AzureLoadBalancer' and 'Internet' can also be used.
+        type: str
+      destination_address_prefixes:
+        description:
+          - The destination address prefixes. CIDR or destination IP ranges.
+        type: list
+      source_port_ranges:
+        description:
+          - The source port ranges.
+        type: list
+      destination_port_ranges:
+        description:
+          - The destination port ranges.
+        type: list
+      access:
+        description:
+          - The network traffic is allowed or denied.
+        type: str
+        choices:
+          - Allow
+          - Deny
+      priority:
+        description:
+          - >-
+            The priority of the rule. The value can be between 100 and 4096. The
+            priority number must be unique for each rule in the collection. The
+            lower the priority number, the higher the priority of the rule.
+        type: int
+      direction:
+        description:
+          - >-
+            The direction of the rule. The direction specifies if rule will be
+            evaluated on incoming or outgoing traffic.
+        type: str
+        choices:
+          - Inbound
+          - Outbound
+  exclusive:
+    description:
+      - >-
+        When used with I(rules), delete security rules of the network security
+        group that are not listed.
+    type: bool
+    default: false
 extends_documentation_fragment:
   - azure
 author:
@@ -153,7 +266,31 @@ EXAMPLES = '''
         network_security_group_name: testnsg
         resource_group_name: rg1
         security_rule_name: rule1
-        
+
+    - name: Make the listed rules the only rules of a network security group
+      azure_rm_securityrule:
+        network_security_group_name: testnsg
+        resource_group_name: rg1
+        exclusive: true
+        rules:
+          - security_rule_name: allow-https
+            protocol: Tcp
+            source_address_prefix: Internet
+            source_port_range: '*'
+            destination_address_prefix: VirtualNetwork
+            destination_port_range: '443'
+            access: Allow
+            priority: 100
+            direction: Inbound
+          - security_rule_name: deny-all
+            protocol: '*'
+            source_address_prefix: '*'
+            source_port_range: '*'
+            destination_address_prefix: '*'
+            destination_port_range: '*'
+            access: Deny
+            priority: 4000
+            direction: Inbound
 
 '''
 
@@ -290,9 +427,34 @@ provisioning_state:
   returned: always
   type: str
   sample: null
+rules:
+  description:
+    - The security rules changed by a I(rules) run.
+  returned: when I(rules) is specified
+  type: list
+  sample: null
+  contains:
+    security_rule_name:
+      description:
+        - The name of the security rule.
+      type: str
+      sample: allow-https
+    action:
+      description:
+        - The change applied to the security rule.
+      type: str
+      sample: create
 
 '''
 
+import errno
+import fcntl
+import os
+import random
+import stat
+import tempfile
+import time
+from collections import OrderedDict
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBaseExt
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -308,6 +470,91 @@ class Actions:
     NoAction, Create, Update, Delete = range(4)
 
 
+SECURITY_RULE_PROPERTIES = ['description',
+                            'protocol',
+                            'source_port_range',
+                            'destination_port_range',
+                            'source_address_prefix',
+                            'source_address_prefixes',
+                            'destination_address_prefix',
+                            'destination_address_prefixes',
+                            'source_port_ranges',
+                            'destination_port_ranges',
+                            'access',
+                            'priority',
+                            'direction']
+
+
+MAX_THROTTLE_RETRIES = 6
+MAX_THROTTLE_DELAY = 300
+# Below this many requests left in the subscription budget every process slows down,
+# up to LOW_BUDGET_DELAY seconds when the budget is spent.
+LOW_BUDGET_REQUESTS = 100
+LOW_BUDGET_DELAY = 30
+RATE_LIMIT_HEADERS = ('x-ms-ratelimit-remaining-subscription-reads',
+                      'x-ms-ratelimit-remaining-subscription-writes',
+                      'x-ms-ratelimit-remaining-subscription-deletes')
+
+
+def throttle_state_path(subscription_id):
+    # The directory must belong to the current user and be private to it, otherwise
+    # another local user could plant the state file; throttling then stays per process.
+    directory = os.path.join(tempfile.gettempdir(), 'ansible-azure-{0}'.format(os.getuid()))
+    try:
+        os.mkdir(directory, 0o700)
+    except OSError as exc:
+        if exc.errno != errno.EEXIST:
+            return None
+    try:
+        info = os.lstat(directory)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        return None
+    return os.path.join(directory, 'throttle-{0}'.format(subscription_id))
+
+
+def read_throttle_deadline(path):
+    if path is None:
+        return 0
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW)
+        with os.fdopen(fd) as state_file:
+            return float(state_file.read() or 0)
+    except (IOError, OSError, ValueError):
+        return 0
+
+
+def remaining_requests(headers):
+    remaining = []
+    for header in RATE_LIMIT_HEADERS:
+        try:
+            remaining.append(int(headers.get(header)))
+        except (TypeError, ValueError):
+            pass
+    return min(remaining) if remaining else None
+
+
+def extend_throttle_deadline(path, deadline):
+    # Concurrent module processes share the file, keep the latest deadline any of them was given.
+    if path is None:
+        return
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        with os.fdopen(fd, 'r+') as state_file:
+            fcntl.flock(state_file, fcntl.LOCK_EX)
+            try:
+                current = float(state_file.read() or 0)
+            except ValueError:
+                current = 0
+            if deadline > current:
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(str(deadline))
+    except (IOError, OSError):
+        pass
+
+
 class AzureRMSecurityRule(AzureRMModuleBaseExt):
     def __init__(self):
         self.module_arg_spec = dict(
@@ -320,8 +567,7 @@ class AzureRMSecurityRule(AzureRMModuleBaseExt):
                 required=True
             ),
             security_rule_name=dict(
-                type='str',
-                required=True
+                type='str'
             ),
             name=dict(
                 type='str',
@@ -384,7 +630,7 @@ class AzureRMSecurityRule(AzureRMModuleBaseExt):
                          'Deny']
             ),
             priority=dict(
-                type='integer',
+                type='int',
                 disposition='/priority'
             ),
             direction=dict(
@@ -397,22 +643,51 @@ class AzureRMSecurityRule(AzureRMModuleBaseExt):
                 type='str',
                 default='present',
                 choices=['present', 'absent']
+            ),
+            exclusive=dict(
+                type='bool',
+                default=False
             )
         )
 
+        self.rule_spec = dict(
+            security_rule_name=dict(
+                type='str',
+                required=True
+            ),
+            state=dict(
+                type='str',
+                default='present',
+                choices=['present', 'absent']
+            )
+        )
+        for key in SECURITY_RULE_PROPERTIES:
+            self.rule_spec[key] = self.module_arg_spec[key]
+        self.module_arg_spec['rules'] = dict(
+            type='list',
+            elements='dict',
+            options=self.rule_spec
+        )
+
         self.resource_group_name = None
         self.network_security_group_name = None
         self.security_rule_name = None
+        self.rules = None
+        self.exclusive = None
         self.body = {}
 
         self.results = dict(changed=False)
         self.mgmt_client = None
         self.state = None
         self.to_do = Actions.NoAction
+        self.throttle_path = None
+        self.throttle_deadline = 0
 
         super(AzureRMSecurityRule, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                   supports_check_mode=True,
-                                                  supports_tags=True)
+                                                  supports_tags=True,
+                                                  mutually_exclusive=[['security_rule_name', 'rules']],
+                                                  required_one_of=[['security_rule_name', 'rules']])
 
     def exec_module(self, **kwargs):
         for key in list(self.module_arg_spec.keys()):
@@ -429,6 +704,12 @@ class AzureRMSecurityRule(AzureRMModuleBaseExt):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager,
                                                     api_version='2020-07-01')
+        self.throttle_path = throttle_state_path(self.subscription_id)
+        self.mgmt_client.config.hooks.append(self.track_rate_limit)
+
+        if self.rules is not None:
+            self.reconcile_rules()
+            return self.results
 
         old_response = self.get_resource()
 
@@ -464,10 +745,11 @@ class AzureRMSecurityRule(AzureRMModuleBaseExt):
 
     def create_update_resource(self):
         try:
-            response = self.mgmt_client.security_rules.create_or_update(resource_group_name=self.resource_group_name,
-                                                                        network_security_group_name=self.network_security_group_name,
-                                                                        security_rule_name=self.security_rule_name,
-                                                                        security_rule_parameters=self.body)
+            response = self.send_request(self.mgmt_client.security_rules.create_or_update,
+                                         resource_group_name=self.resource_group_name,
+                                         network_security_group_name=self.network_security_group_name,
+                                         security_rule_name=self.security_rule_name,
+                                         security_rule_parameters=self.body)
             if isinstance(response, AzureOperationPoller) or isinstance(response, LROPoller):
                 response = self.get_poller_result(response)
         except CloudError as exc:
@@ -477,22 +759,142 @@ class AzureRMSecurityRule(AzureRMModuleBaseExt):
 
     def delete_resource(self):
         try:
-            response = self.mgmt_client.security_rules.delete(resource_group_name=self.resource_group_name,
-                                                              network_security_group_name=self.network_security_group_name,
-                                                              security_rule_name=self.security_rule_name)
+            response = self.send_request(self.mgmt_client.security_rules.delete,
+                                         resource_group_name=self.resource_group_name,
+                                         network_security_group_name=self.network_security_group_name,
+                                         security_rule_name=self.security_rule_name)
         except CloudError as e:
             self.log('Error attempting to delete the SecurityRule instance.')
             self.fail('Error deleting the SecurityRule instance: {0}'.format(str(e)))
 
         return True
 
+    def reconcile_rules(self):
+        # The rules come with the parent, so a single read gives both the current rules and the update body.
+        security_group = self.get_security_group()
+        existing = OrderedDict()
+        for rule in security_group.get('security_rules') or []:
+            existing[rule['name'].lower()] = rule
+
+        modifiers = {}
+        self.create_compare_modifiers(self.rule_spec, '', modifiers)
+        self.results['compare'] = []
+
+        changes = []
+        desired = {}
+        for rule in self.rules:
+            old_response = existing.get(rule['security_rule_name'].lower())
+            body = dict(name=rule['security_rule_name'])
+            for key in SECURITY_RULE_PROPERTIES:
+                if rule.get(key) is not None:
+                    body[key] = rule[key]
+            self.inflate_parameters(self.rule_spec, body, 0)
+            desired[rule['security_rule_name'].lower()] = body
+
+            if rule['state'] == 'absent':
+                if old_response:
+                    changes.append((rule['security_rule_name'], Actions.Delete))
+            elif not old_response:
+                changes.append((rule['security_rule_name'], Actions.Create))
+            elif not self.default_compare(modifiers, body, old_response, '', self.results):
+                changes.append((rule['security_rule_name'], Actions.Update))
+
+        if self.exclusive:
+            for key, rule in existing.items():
+                if key not in desired:
+                    changes.append((rule['name'], Actions.Delete))
+
+        self.results['changed'] = len(changes) > 0
+        self.results['rules'] = [dict(security_rule_name=name,
+                                      action={Actions.Create: 'create',
+                                              Actions.Update: 'update',
+                                              Actions.Delete: 'delete'}[to_do])
+                                 for name, to_do in changes]
+        if self.check_mode or not changes:
+            return
+
+        deleted = set(name.lower() for name, to_do in changes if to_do == Actions.Delete)
+        changed = set(name.lower() for name, to_do in changes if to_do in (Actions.Create, Actions.Update))
+        security_rules = [desired[key] if key in changed else rule
+                          for key, rule in existing.items() if key not in deleted]
+        security_rules.extend(desired[name.lower()] for name, to_do in changes if to_do == Actions.Create)
+        security_group['security_rules'] = security_rules
+        self.update_security_group(security_group)
+
+    def get_security_group(self):
+        try:
+            response = self.send_request(self.mgmt_client.network_security_groups.get,
+                                         resource_group_name=self.resource_group_name,
+                                         network_security_group_name=self.network_security_group_name)
+        except CloudError as e:
+            self.log('Error attempting to get the NetworkSecurityGroup instance.')
+            self.fail('Error getting the NetworkSecurityGroup instance: {0}'.format(str(e)))
+        return response.as_dict()
+
+    def update_security_group(self, security_group):
+        # If-Match keeps rules changed by someone else since the read from being overwritten.
+        try:
+            response = self.send_request(self.mgmt_client.network_security_groups.create_or_update,
+                                         resource_group_name=self.resource_group_name,
+                                         network_security_group_name=self.network_security_group_name,
+                                         parameters=security_group,
+                                         custom_headers={'If-Match': security_group['etag']})
+            if isinstance(response, AzureOperationPoller) or isinstance(response, LROPoller):
+                response = self.get_poller_result(response)
+        except CloudError as exc:
+            self.log('Error attempting to update the NetworkSecurityGroup instance.')
+            self.fail('Error updating the NetworkSecurityGroup instance: {0}'.format(str(exc)))
+        return response.as_dict()
+
+    def send_request(self, operation, **kwargs):
+        for attempt in range(MAX_THROTTLE_RETRIES + 1):
+            deadline = max(read_throttle_deadline(self.throttle_path), self.throttle_deadline)
+            delay = min(deadline - time.time(), MAX_THROTTLE_DELAY)
+            if delay > 0:
+                self.log('Requests to the subscription are throttled, waiting {0:.0f} seconds.'.format(delay))
+                time.sleep(delay)
+            try:
+                return operation(**kwargs)
+            except CloudError as exc:
+                if exc.status_code != 429 or attempt == MAX_THROTTLE_RETRIES:
+                    raise
+                delay = self.retry_after(exc)
+                if delay is None:
+                    delay = min(2 ** attempt, 60) * (1 + random.random())
+                self.throttle(delay)
+
+    def throttle(self, delay):
+        # The local deadline still applies when the shared state file cannot be used.
+        deadline = time.time() + min(max(delay, 0), MAX_THROTTLE_DELAY)
+        self.throttle_deadline = max(self.throttle_deadline, deadline)
+        extend_throttle_deadline(self.throttle_path, deadline)
+
+    def track_rate_limit(self, response, *args, **kwargs):
+        # Response hook of the client, it also sees the requests made by pollers.
+        remaining = remaining_requests(response.headers)
+        if remaining is not None and remaining < LOW_BUDGET_REQUESTS:
+            self.throttle(LOW_BUDGET_DELAY * (LOW_BUDGET_REQUESTS - max(remaining, 0)) / float(LOW_BUDGET_REQUESTS))
+        return response
+
+    def retry_after(self, exc):
+        if exc.response is None:
+            return None
+        try:
+            return int(exc.response.headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
+
     def get_resource(self):
         try:
-            response = self.mgmt_client.security_rules.get(resource_group_name=self.resource_group_name,
-                                                           network_security_group_name=self.network_security_group_name,
-                                                           security_rule_name=self.security_rule_name)
+            response = self.send_request(self.mgmt_client.security_rules.get,
+                                         resource_group_name=self.resource_group_name,
+                                         network_security_group_name=self.network_security_group_name,
+                                         security_rule_name=self.security_rule_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the SecurityRule instance.')
+            self.fail('Error getting the SecurityRule instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
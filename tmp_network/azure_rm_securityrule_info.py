@@ -35,6 +35,21 @@ options:
     description:
       - The name of the security rule.
     type: str
+  analyze:
+    description:
+      - >-
+        Analyze the security rules of the network security group and return the
+        findings in C(analysis).
+      - >-
+        A rule is covered by another rule of the same direction with a higher
+        priority when that rule matches all of its protocols, addresses and
+        ports.
+      - >-
+        Service tags and application security groups are compared by name only,
+        they are not resolved to addresses.
+      - Mutually exclusive with I(security_rule_name).
+    type: bool
+    default: false
 extends_documentation_fragment:
   - azure
 author:
@@ -54,7 +69,12 @@ EXAMPLES = '''
       azure_rm_securityrule_info: 
         network_security_group_name: testnsg
         resource_group_name: rg1
-        
+
+    - name: Find shadowed, redundant and conflicting rules in network security group
+      azure_rm_securityrule_info:
+        network_security_group_name: testnsg
+        resource_group_name: rg1
+        analyze: true
 
 '''
 
@@ -317,9 +337,57 @@ security_rules:
       returned: always
       type: str
       sample: null
+analysis:
+  description:
+    - The findings of I(analyze).
+  returned: when I(analyze) is true
+  type: complex
+  contains:
+    shadowed:
+      description:
+        - >-
+          Rules that never match, because a rule with a higher priority and the
+          opposite access covers them.
+      returned: always
+      type: list
+      sample: [{"name": "allow-ssh", "covered_by": "deny-all-inbound"}]
+    redundant:
+      description:
+        - >-
+          Rules that never match, because a rule with a higher priority and the
+          same access covers them. Removing them does not change the traffic
+          allowed.
+      returned: always
+      type: list
+      sample: [{"name": "allow-https-vnet", "covered_by": "allow-https"}]
+    duplicates:
+      description:
+        - Groups of rules with the same direction, protocol, addresses and ports.
+      returned: always
+      type: list
+      sample: [["allow-https", "allow-https-copy"]]
+    overlapping:
+      description:
+        - >-
+          Rules that partly overlap rules with a higher priority and the opposite
+          access, so that only part of their traffic is matched by them.
+      returned: always
+      type: list
+      sample: [{"name": "allow-web", "overlaps": ["deny-8080"]}]
+    effective_allow:
+      description:
+        - >-
+          For each direction, the allow rules that are not covered by a rule with
+          a higher priority, in priority order.
+      returned: always
+      type: dict
+      sample: {"Inbound": ["allow-https"], "Outbound": []}
 
 '''
 
+from bisect import bisect_left, bisect_right
+from ansible.module_utils._text import to_text
+from ansible.module_utils.compat import ipaddress
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBase
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -331,6 +399,288 @@ except ImportError:
     pass
 
 
+ANY = None
+PORT_RANGE = (0, 65535)
+
+
+def merge_ranges(ranges):
+    merged = []
+    for low, high in sorted(ranges):
+        if merged and low <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], high))
+        else:
+            merged.append((low, high))
+    return merged
+
+
+def address_ranges(prefixes, security_groups):
+    '''
+    Map address prefixes to merged integer ranges per address family. Service
+    tags and application security groups get a family of their own, and ANY
+    stands for the asterisk.
+    '''
+    families = {}
+    for prefix in prefixes:
+        if prefix in ('*', 'Any', 'any'):
+            return ANY
+        try:
+            network = ipaddress.ip_network(to_text(prefix), strict=False)
+            family = network.version
+            value = (int(network.network_address), int(network.broadcast_address))
+        except ValueError:
+            family = 'tag:' + prefix.lower()
+            value = (0, 0)
+        families.setdefault(family, []).append(value)
+    for group in security_groups:
+        families.setdefault('asg:' + group['id'].lower(), []).append((0, 0))
+    return dict((family, merge_ranges(ranges)) for family, ranges in families.items())
+
+
+def port_ranges(ranges):
+    result = []
+    for port_range in ranges:
+        if port_range == '*':
+            return [PORT_RANGE]
+        low, _, high = port_range.partition('-')
+        result.append((int(low), int(high or low)))
+    return merge_ranges(result)
+
+
+def range_covered(outer, low, high):
+    index = bisect_right(outer, (low, PORT_RANGE[1] + 2 ** 128)) - 1
+    return index >= 0 and outer[index][1] >= high
+
+
+def range_overlaps(outer, low, high):
+    index = bisect_left(outer, (low, low))
+    return (index < len(outer) and outer[index][0] <= high) or (index > 0 and outer[index - 1][1] >= low)
+
+
+def addresses_covered(outer, inner):
+    if outer is ANY:
+        return True
+    if inner is ANY:
+        return False
+    return all(family in outer and range_covered(outer[family], low, high)
+               for family, ranges in inner.items() for low, high in ranges)
+
+
+def addresses_overlap(outer, inner):
+    if outer is ANY or inner is ANY:
+        return outer != {} and inner != {}
+    return any(family in outer and range_overlaps(outer[family], low, high)
+               for family, ranges in inner.items() for low, high in ranges)
+
+
+def normalize_rule(rule):
+    def values(single, multiple):
+        return ([rule[single]] if rule.get(single) else []) + (rule.get(multiple) or [])
+
+    return dict(name=rule['name'],
+                priority=rule['priority'],
+                direction=rule['direction'],
+                access=rule['access'],
+                protocol=rule['protocol'].lower(),
+                sources=address_ranges(values('source_address_prefix', 'source_address_prefixes'),
+                                       rule.get('source_application_security_groups') or []),
+                destinations=address_ranges(values('destination_address_prefix', 'destination_address_prefixes'),
+                                            rule.get('destination_application_security_groups') or []),
+                source_ports=port_ranges(values('source_port_range', 'source_port_ranges')),
+                destination_ports=port_ranges(values('destination_port_range', 'destination_port_ranges')))
+
+
+def rule_covers(outer, inner):
+    return ((outer['protocol'] == '*' or outer['protocol'] == inner['protocol']) and
+            all(range_covered(outer['destination_ports'], low, high) for low, high in inner['destination_ports']) and
+            all(range_covered(outer['source_ports'], low, high) for low, high in inner['source_ports']) and
+            addresses_covered(outer['sources'], inner['sources']) and
+            addresses_covered(outer['destinations'], inner['destinations']))
+
+
+def rules_overlap(first, second):
+    return ((first['protocol'] == '*' or second['protocol'] == '*' or first['protocol'] == second['protocol']) and
+            any(range_overlaps(first['destination_ports'], low, high) for low, high in second['destination_ports']) and
+            any(range_overlaps(first['source_ports'], low, high) for low, high in second['source_ports']) and
+            addresses_overlap(first['sources'], second['sources']) and
+            addresses_overlap(first['destinations'], second['destinations']))
+
+
+def rule_signature(rule):
+    def frozen(addresses):
+        return None if addresses is ANY else tuple(sorted((str(family), tuple(ranges)) for family, ranges in addresses.items()))
+
+    return (rule['direction'], rule['protocol'], frozen(rule['sources']), frozen(rule['destinations']),
+            tuple(rule['source_ports']), tuple(rule['destination_ports']))
+
+
+RULE_DIMENSIONS = ('destination_ports', 'destinations', 'sources', 'source_ports')
+
+
+def dimension_ranges(rule, dimension):
+    '''
+    Return the ranges of a rule in one dimension keyed by family, or ANY when
+    the rule matches everything there, a port range of PORT_RANGE included.
+    '''
+    value = rule[dimension]
+    if not dimension.endswith('_ports'):
+        return value
+    if not value:
+        return {}
+    return ANY if value == [PORT_RANGE] else {'port': value}
+
+
+class IntervalIndex(object):
+    '''
+    Growing set of closed intervals over a fixed set of bounds. An interval
+    overlaps [low, high] when it contains low, found by stabbing a segment
+    tree, or when it starts in (low, high], found by bisecting the starts.
+    '''
+
+    def __init__(self, bounds):
+        self.bounds = sorted(bounds)
+        self.size = 1
+        while self.size < len(self.bounds):
+            self.size *= 2
+        self.nodes = {}
+        self.starts = []
+        self.start_items = []
+
+    def add(self, low, high, item):
+        low = bisect_left(self.bounds, low)
+        high = bisect_left(self.bounds, high)
+        position = bisect_right(self.starts, low)
+        self.starts.insert(position, low)
+        self.start_items.insert(position, item)
+        low += self.size
+        high += self.size + 1
+        while low < high:
+            if low & 1:
+                self.nodes.setdefault(low, []).append(item)
+                low += 1
+            if high & 1:
+                high -= 1
+                self.nodes.setdefault(high, []).append(item)
+            low //= 2
+            high //= 2
+
+    def stabbing(self, point):
+        node = point + self.size
+        while node:
+            if node in self.nodes:
+                yield self.nodes[node]
+            node //= 2
+
+    def starting(self, low, high):
+        return bisect_right(self.starts, low), bisect_right(self.starts, high)
+
+    def count(self, low, high):
+        low = bisect_left(self.bounds, low)
+        first, last = self.starting(low, bisect_left(self.bounds, high))
+        return sum(len(items) for items in self.stabbing(low)) + last - first
+
+    def find(self, low, high):
+        low = bisect_left(self.bounds, low)
+        first, last = self.starting(low, bisect_left(self.bounds, high))
+        found = self.start_items[first:last]
+        for items in self.stabbing(low):
+            found.extend(items)
+        return found
+
+
+class RuleIndex(object):
+    '''
+    The rules added so far, with an interval index per dimension and family.
+    Rules matching anything in a dimension are kept in a list of their own
+    instead of spanning its whole index.
+    '''
+
+    def __init__(self, rules):
+        bounds = {}
+        for rule in rules:
+            for dimension in RULE_DIMENSIONS:
+                for family, ranges in (dimension_ranges(rule, dimension) or {}).items():
+                    bounds.setdefault((dimension, family), set()).update(bound for pair in ranges for bound in pair)
+        self.intervals = dict((key, IntervalIndex(points)) for key, points in bounds.items())
+        self.any = dict((dimension, []) for dimension in RULE_DIMENSIONS)
+        self.items = []
+
+    def add(self, item, rule):
+        self.items.append(item)
+        for dimension in RULE_DIMENSIONS:
+            families = dimension_ranges(rule, dimension)
+            if families is ANY:
+                self.any[dimension].append(item)
+                continue
+            for family, ranges in families.items():
+                for low, high in ranges:
+                    self.intervals[(dimension, family)].add(low, high, item)
+
+    def candidates(self, rule):
+        '''
+        Return the added items that may overlap the rule, in the order they were
+        added. They are read from the dimension where the rule has the fewest.
+        '''
+        best = None
+        for dimension in RULE_DIMENSIONS:
+            families = dimension_ranges(rule, dimension)
+            if not families:
+                continue
+            count = len(self.any[dimension]) + sum(self.intervals[(dimension, family)].count(low, high)
+                                                   for family, ranges in families.items() for low, high in ranges)
+            if best is None or count < best[0]:
+                best = (count, dimension, families)
+        if best is None:
+            return list(self.items)
+        count, dimension, families = best
+        found = set(self.any[dimension])
+        for family, ranges in families.items():
+            for low, high in ranges:
+                found.update(self.intervals[(dimension, family)].find(low, high))
+        return sorted(found)
+
+
+def analyze_rules(rules):
+    '''
+    Find shadowed, redundant, duplicate and conflicting rules.
+
+    Rules of each direction are added to a RuleIndex in priority order once
+    they are known not to be covered, so a rule is only compared with the
+    higher priority rules sharing its most selective dimension instead of
+    with every other rule.
+    '''
+    analysis = dict(shadowed=[], redundant=[], duplicates=[], overlapping=[], effective_allow={})
+    rules = sorted((normalize_rule(rule) for rule in rules), key=lambda rule: rule['priority'])
+
+    signatures = {}
+    for rule in rules:
+        signatures.setdefault(rule_signature(rule), []).append(rule['name'])
+    analysis['duplicates'] = [names for names in signatures.values() if len(names) > 1]
+
+    for direction in sorted(set(rule['direction'] for rule in rules)):
+        direction_rules = [rule for rule in rules if rule['direction'] == direction]
+        index = RuleIndex(direction_rules)
+        effective_allow = []
+        for position, rule in enumerate(direction_rules):
+            if not rule['destination_ports']:
+                continue
+            candidates = [direction_rules[candidate] for candidate in index.candidates(rule)]
+            covered_by = next((candidate for candidate in candidates if rule_covers(candidate, rule)), None)
+            if covered_by is not None:
+                finding = dict(name=rule['name'], covered_by=covered_by['name'])
+                analysis['redundant' if covered_by['access'] == rule['access'] else 'shadowed'].append(finding)
+                continue
+            if rule['access'] == 'Allow':
+                effective_allow.append(rule['name'])
+
+            overlaps = [candidate['name'] for candidate in candidates
+                        if candidate['access'] != rule['access'] and rules_overlap(candidate, rule)]
+            if overlaps:
+                analysis['overlapping'].append(dict(name=rule['name'], overlaps=overlaps))
+            index.add(position, rule)
+        analysis['effective_allow'][direction] = effective_allow
+    return analysis
+
+
 class AzureRMSecurityRuleInfo(AzureRMModuleBase):
     def __init__(self):
         self.module_arg_spec = dict(
@@ -344,12 +694,17 @@ class AzureRMSecurityRuleInfo(AzureRMModuleBase):
             ),
             security_rule_name=dict(
                 type='str'
+            ),
+            analyze=dict(
+                type='bool',
+                default=False
             )
         )
 
         self.resource_group_name = None
         self.network_security_group_name = None
         self.security_rule_name = None
+        self.analyze = None
 
         self.results = dict(changed=False)
         self.mgmt_client = None
@@ -363,7 +718,9 @@ class AzureRMSecurityRuleInfo(AzureRMModuleBase):
         self.header_parameters['Content-Type'] = 'application/json; charset=utf-8'
 
         self.mgmt_client = None
-        super(AzureRMSecurityRuleInfo, self).__init__(self.module_arg_spec, supports_tags=True)
+        super(AzureRMSecurityRuleInfo, self).__init__(self.module_arg_spec,
+                                                      mutually_exclusive=[['security_rule_name', 'analyze']],
+                                                      supports_tags=True)
 
     def exec_module(self, **kwargs):
 
@@ -381,6 +738,8 @@ class AzureRMSecurityRuleInfo(AzureRMModuleBase):
         elif (self.resource_group_name is not None and
               self.network_security_group_name is not None):
             self.results['security_rules'] = self.format_item(self.list())
+            if self.analyze:
+                self.results['analysis'] = analyze_rules(self.results['security_rules'])
         return self.results
 
     def get(self):
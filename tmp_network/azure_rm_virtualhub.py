@@ -191,6 +191,16 @@ options:
     choices:
       - absent
       - present
+  wait:
+    description:
+      - How long to wait for the create, update or delete operation to finish.
+      - C(true) waits until the operation completes, C(false) returns as soon as
+        the request has been accepted, and a number waits at most that many seconds.
+      - >-
+        When the operation is still running the module returns
+        C(operation_status), use M(azure_rm_virtualhub_info) to poll C(provisioning_state).
+    type: raw
+    default: true
 extends_documentation_fragment:
   - azure
 author:
@@ -209,7 +219,21 @@ EXAMPLES = '''
       azure_rm_virtualhub: 
         resource_group_name: rg1
         virtual_hub_name: virtualHub1
-        
+
+    - name: Start updates of several VirtualHub instances without waiting
+      azure_rm_virtualhub:
+        resource_group_name: rg1
+        virtual_hub_name: "{{ item }}"
+        wait: false
+      loop: "{{ names }}"
+
+    - name: Wait until every VirtualHub in the resource group has finished updating
+      azure_rm_virtualhub_info:
+        resource_group_name: rg1
+      register: output
+      until: output.virtual_hubs | selectattr('provisioning_state', 'equalto', 'Updating') | list | length == 0
+      retries: 120
+      delay: 30
 
 '''
 
@@ -480,9 +504,18 @@ enable_virtual_router_route_propogation:
   returned: always
   type: bool
   sample: null
+operation_status:
+  description:
+    - >-
+      Status of the long running operation when it had not finished within
+      I(wait).
+  returned: when the operation is still running
+  type: str
+  sample: InProgress
 
 '''
 
+from ansible.module_utils.parsing.convert_bool import boolean
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBaseExt
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -685,11 +718,17 @@ class AzureRMVirtualHub(AzureRMModuleBaseExt):
                 type='str',
                 default='present',
                 choices=['present', 'absent']
+            ),
+            wait=dict(
+                type='raw',
+                default=True
             )
         )
 
         self.resource_group_name = None
         self.virtual_hub_name = None
+        self.wait = None
+        self.wait_seconds = None
         self.body = {}
 
         self.results = dict(changed=False)
@@ -709,6 +748,7 @@ class AzureRMVirtualHub(AzureRMModuleBaseExt):
                 self.body[key] = kwargs[key]
 
         self.inflate_parameters(self.module_arg_spec, self.body, 0)
+        self.wait_seconds = self.wait_timeout()
 
         old_response = None
         response = None
@@ -755,28 +795,59 @@ class AzureRMVirtualHub(AzureRMModuleBaseExt):
                                                                       virtual_hub_name=self.virtual_hub_name,
                                                                       virtual_hub_parameters=self.body)
             if isinstance(response, AzureOperationPoller) or isinstance(response, LROPoller):
-                response = self.get_poller_result(response)
+                response = self.wait_for_poller(response)
         except CloudError as exc:
             self.log('Error attempting to create the VirtualHub instance.')
             self.fail('Error creating the VirtualHub instance: {0}'.format(str(exc)))
-        return response.as_dict()
+        return response.as_dict() if response else None
 
     def delete_resource(self):
         try:
             response = self.mgmt_client.virtual_hubs.delete(resource_group_name=self.resource_group_name,
                                                             virtual_hub_name=self.virtual_hub_name)
+            if isinstance(response, AzureOperationPoller) or isinstance(response, LROPoller):
+                self.wait_for_poller(response)
         except CloudError as e:
             self.log('Error attempting to delete the VirtualHub instance.')
             self.fail('Error deleting the VirtualHub instance: {0}'.format(str(e)))
 
         return True
 
+    def wait_for_poller(self, poller):
+        timeout = self.wait_seconds
+        if timeout is None:
+            return self.get_poller_result(poller)
+        if timeout > 0:
+            poller.wait(timeout=timeout)
+        if poller.done():
+            return poller.result()
+        self.results['operation_status'] = poller.status()
+        return None
+
+    def wait_timeout(self):
+        # None waits until the operation is done, otherwise the number of seconds to wait.
+        if isinstance(self.wait, bool):
+            return None if self.wait else 0
+        try:
+            timeout = int(self.wait)
+        except (TypeError, ValueError):
+            try:
+                return None if boolean(self.wait) else 0
+            except TypeError:
+                timeout = -1
+        if timeout < 0:
+            self.fail('wait must be a boolean or a non-negative number of seconds, got {0}'.format(self.wait))
+        return timeout
+
     def get_resource(self):
         try:
             response = self.mgmt_client.virtual_hubs.get(resource_group_name=self.resource_group_name,
                                                          virtual_hub_name=self.virtual_hub_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the VirtualHub instance.')
+            self.fail('Error getting the VirtualHub instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
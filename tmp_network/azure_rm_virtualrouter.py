@@ -373,7 +373,10 @@ class AzureRMVirtualRouter(AzureRMModuleBaseExt):
                                                             virtual_router_name=self.virtual_router_name,
                                                             expand=self.expand)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the VirtualRouter instance.')
+            self.fail('Error getting the VirtualRouter instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -360,7 +360,10 @@ class AzureRMVirtualWan(AzureRMModuleBaseExt):
             response = self.mgmt_client.virtual_wans.get(resource_group_name=self.resource_group_name,
                                                          virtual_wan_name=self.virtual_wan_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the VirtualWan instance.')
+            self.fail('Error getting the VirtualWan instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -505,6 +505,16 @@ options:
     choices:
       - absent
       - present
+  wait:
+    description:
+      - How long to wait for the create, update or delete operation to finish.
+      - C(true) waits until the operation completes, C(false) returns as soon as
+        the request has been accepted, and a number waits at most that many seconds.
+      - >-
+        When the operation is still running the module returns
+        C(operation_status), use M(azure_rm_vpngateway_info) to poll C(provisioning_state).
+    type: raw
+    default: true
 extends_documentation_fragment:
   - azure
 author:
@@ -523,7 +533,21 @@ EXAMPLES = '''
       azure_rm_vpngateway: 
         gateway_name: gateway1
         resource_group_name: rg1
-        
+
+    - name: Start updates of several VpnGateway instances without waiting
+      azure_rm_vpngateway:
+        resource_group_name: rg1
+        gateway_name: "{{ item }}"
+        wait: false
+      loop: "{{ names }}"
+
+    - name: Wait until every VpnGateway in the resource group has finished updating
+      azure_rm_vpngateway_info:
+        resource_group_name: rg1
+      register: output
+      until: output.vpn_gateways | selectattr('provisioning_state', 'equalto', 'Updating') | list | length == 0
+      retries: 120
+      delay: 30
 
 '''
 
@@ -1054,9 +1078,18 @@ is_routing_preference_internet:
   returned: always
   type: bool
   sample: null
+operation_status:
+  description:
+    - >-
+      Status of the long running operation when it had not finished within
+      I(wait).
+  returned: when the operation is still running
+  type: str
+  sample: InProgress
 
 '''
 
+from ansible.module_utils.parsing.convert_bool import boolean
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBaseExt
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -1537,11 +1570,17 @@ class AzureRMVpnGateway(AzureRMModuleBaseExt):
                 type='str',
                 default='present',
                 choices=['present', 'absent']
+            ),
+            wait=dict(
+                type='raw',
+                default=True
             )
         )
 
         self.resource_group_name = None
         self.gateway_name = None
+        self.wait = None
+        self.wait_seconds = None
         self.body = {}
 
         self.results = dict(changed=False)
@@ -1561,6 +1600,7 @@ class AzureRMVpnGateway(AzureRMModuleBaseExt):
                 self.body[key] = kwargs[key]
 
         self.inflate_parameters(self.module_arg_spec, self.body, 0)
+        self.wait_seconds = self.wait_timeout()
 
         old_response = None
         response = None
@@ -1607,28 +1647,59 @@ class AzureRMVpnGateway(AzureRMModuleBaseExt):
                                                                       gateway_name=self.gateway_name,
                                                                       vpn_gateway_parameters=self.body)
             if isinstance(response, AzureOperationPoller) or isinstance(response, LROPoller):
-                response = self.get_poller_result(response)
+                response = self.wait_for_poller(response)
         except CloudError as exc:
             self.log('Error attempting to create the VpnGateway instance.')
             self.fail('Error creating the VpnGateway instance: {0}'.format(str(exc)))
-        return response.as_dict()
+        return response.as_dict() if response else None
 
     def delete_resource(self):
         try:
             response = self.mgmt_client.vpn_gateways.delete(resource_group_name=self.resource_group_name,
                                                             gateway_name=self.gateway_name)
+            if isinstance(response, AzureOperationPoller) or isinstance(response, LROPoller):
+                self.wait_for_poller(response)
         except CloudError as e:
             self.log('Error attempting to delete the VpnGateway instance.')
             self.fail('Error deleting the VpnGateway instance: {0}'.format(str(e)))
 
         return True
 
+    def wait_for_poller(self, poller):
+        timeout = self.wait_seconds
+        if timeout is None:
+            return self.get_poller_result(poller)
+        if timeout > 0:
+            poller.wait(timeout=timeout)
+        if poller.done():
+            return poller.result()
+        self.results['operation_status'] = poller.status()
+        return None
+
+    def wait_timeout(self):
+        # None waits until the operation is done, otherwise the number of seconds to wait.
+        if isinstance(self.wait, bool):
+            return None if self.wait else 0
+        try:
+            timeout = int(self.wait)
+        except (TypeError, ValueError):
+            try:
+                return None if boolean(self.wait) else 0
+            except TypeError:
+                timeout = -1
+        if timeout < 0:
+            self.fail('wait must be a boolean or a non-negative number of seconds, got {0}'.format(self.wait))
+        return timeout
+
     def get_resource(self):
         try:
             response = self.mgmt_client.vpn_gateways.get(resource_group_name=self.resource_group_name,
                                                          gateway_name=self.gateway_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the VpnGateway instance.')
+            self.fail('Error getting the VpnGateway instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -29,6 +29,15 @@ options:
     description:
       - The name of the gateway.
     type: str
+  fields:
+    description:
+      - >-
+        Only return these attributes of each VpnGateway. Use dotted paths for nested
+        attributes, for example C(bgp_settings.asn); paths
+        continue through lists element by element.
+      - When not specified, the complete VpnGateway is returned.
+    type: list
+    elements: str
 extends_documentation_fragment:
   - azure
 author:
@@ -49,7 +58,15 @@ EXAMPLES = '''
         
 
     - name: VpnGatewayListBySubscription
-      azure_rm_vpngateway_info: 
+      azure_rm_vpngateway_info:
+
+    - name: List the name and provisioning state of VpnGateways in a resource group
+      azure_rm_vpngateway_info:
+        resource_group_name: rg1
+        fields:
+          - id
+          - name
+          - provisioning_state
 
 '''
 
@@ -1097,6 +1114,7 @@ vpn_gateways:
 
 '''
 
+from collections import OrderedDict
 from ansible_collections.azure.azcollection.plugins.module_utils.azure_rm_common_ext import AzureRMModuleBase
 try:
     from msrestazure.azure_exceptions import CloudError
@@ -1108,6 +1126,36 @@ except ImportError:
     pass
 
 
+def to_plain(value):
+    if hasattr(value, 'as_dict'):
+        return value.as_dict()
+    if isinstance(value, list):
+        return [to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return dict((key, to_plain(item)) for key, item in value.items())
+    return value
+
+
+def project_fields(value, paths):
+    '''
+    Return only the attribute paths of an SDK model, converting just the
+    selected values. Paths continue through lists element by element.
+    '''
+    if isinstance(value, list):
+        return [project_fields(item, paths) for item in value]
+    if [] in paths or not (hasattr(value, 'as_dict') or isinstance(value, dict)):
+        return to_plain(value)
+    result = {}
+    children = OrderedDict()
+    for path in paths:
+        children.setdefault(path[0], []).append(path[1:])
+    for name, child_paths in children.items():
+        child = value.get(name) if isinstance(value, dict) else getattr(value, name, None)
+        if child is not None:
+            result[name] = project_fields(child, child_paths)
+    return result
+
+
 class AzureRMVpnGatewayInfo(AzureRMModuleBase):
     def __init__(self):
         self.module_arg_spec = dict(
@@ -1116,11 +1164,16 @@ class AzureRMVpnGatewayInfo(AzureRMModuleBase):
             ),
             gateway_name=dict(
                 type='str'
+            ),
+            fields=dict(
+                type='list',
+                elements='str'
             )
         )
 
         self.resource_group_name = None
         self.gateway_name = None
+        self.fields = None
 
         self.results = dict(changed=False)
         self.mgmt_client = None
@@ -1186,14 +1239,19 @@ class AzureRMVpnGatewayInfo(AzureRMModuleBase):
         return response
 
     def format_item(self, item):
+        if item is None:
+            return []
         if hasattr(item, 'as_dict'):
-            return [item.as_dict()]
-        else:
-            result = []
-            items = list(item)
-            for tmp in items:
-                result.append(tmp.as_dict())
-            return result
+            return [self.convert_item(item)]
+        result = []
+        for tmp in item:
+            result.append(self.convert_item(tmp))
+        return result
+
+    def convert_item(self, item):
+        if self.fields is None:
+            return item.as_dict()
+        return project_fields(item, [field.split('.') for field in self.fields])
 
 
 def main():
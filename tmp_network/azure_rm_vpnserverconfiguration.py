@@ -1361,7 +1361,10 @@ class AzureRMVpnServerConfiguration(AzureRMModuleBaseExt):
             response = self.mgmt_client.vpn_server_configurations.get(resource_group_name=self.resource_group_name,
                                                                       vpn_server_configuration_name=self.vpn_server_configuration_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the VpnServerConfiguration instance.')
+            self.fail('Error getting the VpnServerConfiguration instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
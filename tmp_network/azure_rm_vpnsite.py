@@ -794,7 +794,10 @@ class AzureRMVpnSite(AzureRMModuleBaseExt):
             response = self.mgmt_client.vpn_sites.get(resource_group_name=self.resource_group_name,
                                                       vpn_site_name=self.vpn_site_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the VpnSite instance.')
+            self.fail('Error getting the VpnSite instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -269,7 +269,10 @@ class AzureRMVpnSiteLink(AzureRMModuleBaseExt):
                                                            vpn_site_name=self.vpn_site_name,
                                                            vpn_site_link_name=self.vpn_site_link_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the VpnSiteLink instance.')
+            self.fail('Error getting the VpnSiteLink instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -157,7 +157,10 @@ class AzureRMVpnSitesConfiguration(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.vpn_sites_configuration.get()
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the VpnSitesConfiguration instance.')
+            self.fail('Error getting the VpnSitesConfiguration instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
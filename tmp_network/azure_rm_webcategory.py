@@ -206,7 +206,10 @@ class AzureRMWebCategory(AzureRMModuleBaseExt):
             response = self.mgmt_client.web_categories.get(name=self.name,
                                                            expand=self.expand)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the WebCategory instance.')
+            self.fail('Error getting the WebCategory instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -271,7 +271,10 @@ class AzureRMAlia(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.alias.get(alias_name=self.alias_name)
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the Alia instance.')
+            self.fail('Error getting the Alia instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -158,7 +158,10 @@ class AzureRMSubscription(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.subscription.get()
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the Subscription instance.')
+            self.fail('Error getting the Subscription instance: {0}'.format(str(e)))
         return response.as_dict()
 
 
@@ -156,7 +156,10 @@ class AzureRMTenant(AzureRMModuleBaseExt):
         try:
             response = self.mgmt_client.tenants.get()
         except CloudError as e:
-            return False
+            if e.status_code == 404:
+                return False
+            self.log('Error attempting to get the Tenant instance.')
+            self.fail('Error getting the Tenant instance: {0}'.format(str(e)))
         return response.as_dict()
 
 